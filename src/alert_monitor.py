@@ -1,19 +1,60 @@
 """MT4 Alert log file monitoring module."""
 
+import functools
+import logging
+import os
 import re
-from datetime import date, datetime
+import select
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
 
-from watchdog.events import (
-    FileCreatedEvent,
-    FileModifiedEvent,
-    FileSystemEvent,
-    FileSystemEventHandler,
+from .logger import logger
+
+# watchdog is only imported when its Observer is actually used (see start())
+if TYPE_CHECKING:
+    from watchdog.events import FileSystemEvent
+
+# Bytes read from the alert log per os.read() call
+READ_CHUNK_SIZE = 65536
+
+# Backslash at end of line joins it with the next one, leading blanks dropped
+_CONTINUATION_RE = re.compile(rb"\\[ \t]*\r?\n[ \t]*")
+
+# Text of a non-blank line without its surrounding whitespace ("." stops at \n)
+_LINE_RE = re.compile(r"\S(?:.*\S)?")
+
+# Symbol named by an entry alert ("Ark_... BUY XAUUSD SL:... TP:..."), for
+# pre-filtering. Anchored and matched like SignalParser.ENTRY_PATTERN, so it
+# picks the same BUY/SELL the parser does and never drops a line it would accept
+_ENTRY_SYMBOL_RE = re.compile(
+    r"Ark_\S*.*?\b(?:BUY|SELL)\s+(\S+)"
+    r"\s+SL:\s*\d+(?:\.\d+)?\s+TP:\s*\d+(?:\.\d+)?(?!\S)",
+    re.IGNORECASE,
 )
-from watchdog.observers import Observer
 
-from .logger import logger
+# Already-read bytes to accumulate before asking the kernel to drop their pages
+FADVISE_DONTNEED_BYTES = 1024 * 1024
+
+# Window used by AlertMonitor to coalesce bursts of modify events into one read
+READ_DEBOUNCE_SECONDS = 0.01
+
+# Alert lines buffered between the file reader and the callback worker
+LINE_QUEUE_MAXSIZE = 10000
+
+# Native inotify backend (Linux only), falls back to watchdog elsewhere
+try:
+    from inotify_simple import INotify
+    from inotify_simple import flags as inotify_flags
+
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+    INotify = None
+    inotify_flags = None
 
 
 def resolve_log_path(path_pattern: str | Path) -> Path:
@@ -38,29 +79,56 @@ def resolve_log_path(path_pattern: str | Path) -> Path:
         Path("C:/logs/20250116.log")
     """
     path_str = str(path_pattern)
-    today_str = date.today().strftime("%Y%m%d")
 
-    # Replace date placeholders
-    path_str = path_str.replace("{date}", today_str)
-    path_str = path_str.replace("{today}", today_str)
+    # Replace date placeholders; plain paths skip the substitution entirely
+    if "{" in path_str:
+        today_str = _today_str()
+        path_str = path_str.replace("{date}", today_str).replace("{today}", today_str)
 
     resolved_path = Path(path_str)
 
     # If it's a directory, find the latest log file
-    if resolved_path.is_dir():
-        log_files = list(resolved_path.glob("*.log"))
-        if log_files:
-            # Sort by modification time, get the latest
-            latest = max(log_files, key=lambda f: f.stat().st_mtime)
-            logger.info(f"Auto-detected latest log file: {latest}")
-            return latest
-        else:
-            # Return expected today's log file
-            expected = resolved_path / f"{today_str}.log"
-            logger.info(f"No log files found, expecting: {expected}")
-            return expected
+    try:
+        latest_entry = _find_latest_log(resolved_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return resolved_path
+
+    if latest_entry is not None:
+        latest = Path(latest_entry.path)
+        logger.info(f"Auto-detected latest log file: {latest}")
+        return latest
+
+    # Return expected today's log file
+    expected = resolved_path / get_today_log_filename()
+    logger.info(f"No log files found, expecting: {expected}")
+    return expected
+
+
+def _find_latest_log(directory: str | Path) -> Optional["os.DirEntry[str]"]:
+    """Find the most recently modified .log file in a directory.
+
+    Single os.scandir pass keeping the running maximum; DirEntry.stat() is
+    cached on the entry, so each file is stat'ed at most once.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Entry of the latest log file, or None if there is none.
 
-    return resolved_path
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        NotADirectoryError: If the path is not a directory.
+    """
+    latest = None
+    latest_mtime = -1.0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".log") and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry, mtime
+    return latest
 
 
 def get_today_log_filename() -> str:
@@ -69,36 +137,136 @@ def get_today_log_filename() -> str:
     Returns:
         Today's log filename.
     """
-    return date.today().strftime("%Y%m%d") + ".log"
+    return _today_str() + ".log"
+
+
+def _today_str() -> str:
+    """Get today's date as YYYYMMDD, formatted once per day.
+
+    Returns:
+        Today's date string.
+    """
+    return _date_str_for(date.today().toordinal())
 
 
-class AlertFileHandler(FileSystemEventHandler):
-    """Handler for alert log file changes."""
+@functools.lru_cache(maxsize=1)
+def _date_str_for(day_ordinal: int) -> str:
+    """Format a day as YYYYMMDD, cached until the day changes.
+
+    Args:
+        day_ordinal: Proleptic Gregorian ordinal of the day.
+
+    Returns:
+        Date string in YYYYMMDD format.
+    """
+    return date.fromordinal(day_ordinal).strftime("%Y%m%d")
+
+
+def _stat_or_none(path: str | Path) -> Optional[os.stat_result]:
+    """Stat a file, treating a missing file as None.
+
+    Args:
+        path: Path to stat.
+
+    Returns:
+        Stat result, or None if the file does not exist.
+    """
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _compute_next_midnight() -> float:
+    """Get the epoch timestamp of the next local midnight.
+
+    Returns:
+        Seconds since the epoch at which the local date next changes.
+    """
+    tomorrow = date.today() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+
+class AlertFileHandler:
+    """Handler for alert log file changes.
+
+    Implements the watchdog event handler interface (``dispatch``) without
+    subclassing FileSystemEventHandler, so watchdog isn't imported unless the
+    watchdog backend is used.
+    """
 
     def __init__(
         self,
         file_path: Path,
-        callback: Callable[[str], None],
+        callback: Optional[Callable[[str], None]] = None,
         auto_switch_date: bool = True,
+        initial_position: Optional[int] = None,
+        debounce_seconds: float = 0.0,
+        batch_callback: Optional[Callable[[list[str]], None]] = None,
     ):
         """Initialize handler.
 
         Args:
             file_path: Path to alert log file.
-            callback: Function to call with new alert lines.
+            callback: Function to call with each new alert line.
             auto_switch_date: Auto-switch to new log file at midnight.
+            initial_position: Byte offset to start reading from. When None,
+                the current size of the file is used (0 if it doesn't exist).
+            debounce_seconds: Delay used to coalesce bursts of modify events
+                into a single read. 0 reads synchronously on every event.
+            batch_callback: Alternative to ``callback`` that is called once
+                per read with all new alert lines.
+
+        Raises:
+            ValueError: If not exactly one of callback and batch_callback
+                is given.
         """
-        super().__init__()
+        if (callback is None) == (batch_callback is None):
+            raise ValueError("Exactly one of callback and batch_callback is required")
+
         self.file_path = file_path
         self.callback = callback
+        self.batch_callback = batch_callback
         self.auto_switch_date = auto_switch_date
         self._last_position = 0
         self._current_date = date.today()
+        self._next_midnight_epoch = _compute_next_midnight()
         self._monitor_directory = file_path.parent
+        # String form for comparing against event paths without building a Path
+        self._monitor_dir_str = os.path.normcase(str(file_path.parent))
+
+        # Persistent read state, opened lazily on first read
+        self._fd: Optional[int] = None
+        self._tail = bytearray()
+        self._released_position = 0
+
+        # Debounced reads run on one long-lived thread, started on the first
+        # modify event, so serialize access to read state
+        self._debounce_seconds = debounce_seconds
+        self._debounce_thread: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+        self._read_wakeup = threading.Condition(self._lock)
+        self._read_pending = False
+        # Set by close(); no read may reopen the file afterwards
+        self._closed = False
 
         # Initialize position to end of file
-        if file_path.exists():
-            self._last_position = file_path.stat().st_size
+        if initial_position is not None:
+            self._last_position = initial_position
+        elif (st := _stat_or_none(file_path)) is not None:
+            self._last_position = st.st_size
+
+    @property
+    def file_path(self) -> Path:
+        """Path of the log file currently being monitored."""
+        return self._file_path
+
+    @file_path.setter
+    def file_path(self, value: Path) -> None:
+        self._file_path = value
+        # Cached so event filtering can compare strings without building a Path
+        self._target_name = value.name
+        self._target_str = os.path.normcase(str(value))
 
     def _check_for_newer_log(self) -> bool:
         """Check if a newer log file exists in the directory.
@@ -110,23 +278,18 @@ class AlertFileHandler(FileSystemEventHandler):
             True if switched to a newer file, False otherwise.
         """
         try:
-            log_files = list(self._monitor_directory.glob("*.log"))
-            if not log_files:
-                return False
-
             # Find the latest log file by modification time
-            latest_file = max(log_files, key=lambda f: f.stat().st_mtime)
+            latest_entry = _find_latest_log(self._monitor_directory)
+            if latest_entry is None:
+                return False
+            latest_file = Path(latest_entry.path)
 
             # Switch if we found a newer file
             if latest_file != self.file_path:
                 logger.info(
                     f"Newer log file detected, switching from {self.file_path.name} to {latest_file.name}"
                 )
-                self.file_path = latest_file
-                self._last_position = 0
-
-                if latest_file.exists():
-                    self._last_position = latest_file.stat().st_size
+                self.switch_to(latest_file, latest_entry.stat().st_size)
 
                 return True
 
@@ -153,115 +316,433 @@ class AlertFileHandler(FileSystemEventHandler):
                 return True
 
             # Fallback to date-based filename
-            new_filename = get_today_log_filename()
-            new_path = self.file_path.parent / new_filename
+            new_path = self._monitor_directory / get_today_log_filename()
 
             logger.info(f"Date changed, switching to: {new_path}")
-            self.file_path = new_path
-            self._last_position = 0
-
-            if new_path.exists():
-                self._last_position = new_path.stat().st_size
+            st = _stat_or_none(new_path)
+            self.switch_to(new_path, st.st_size if st else 0)
 
             return True
         return False
 
-    def on_modified(self, event: FileSystemEvent) -> None:
+    def dispatch(self, event: "FileSystemEvent") -> None:
+        """Route a watchdog event to the matching handler method.
+
+        Args:
+            event: File system event.
+        """
+        if event.event_type == "modified":
+            self.on_modified(event)
+        elif event.event_type == "created":
+            self.on_created(event)
+
+    def on_modified(self, event: "FileSystemEvent") -> None:
         """Handle file modification event.
 
         Args:
             event: File system event.
         """
-        if not isinstance(event, FileModifiedEvent):
+        if event.is_directory or event.event_type != "modified":
             return
 
-        self._check_date_change()
-
         src_path = event.src_path
         if isinstance(src_path, bytes):
             src_path = src_path.decode("utf-8")
 
-        event_path = Path(src_path)
-        if event_path != self.file_path:
+        # Drop events for the other logs in the directory before any Path work
+        if not src_path.endswith(self._target_name):
             return
 
-        self._read_new_lines()
+        self.handle_modified(src_path)
 
-    def on_created(self, event: FileSystemEvent) -> None:
+    def on_created(self, event: "FileSystemEvent") -> None:
         """Handle file creation event (for new daily log files).
 
         Args:
             event: File system event.
         """
-        if not isinstance(event, FileCreatedEvent):
+        if event.is_directory or event.event_type != "created":
             return
 
         src_path = event.src_path
         if isinstance(src_path, bytes):
             src_path = src_path.decode("utf-8")
 
-        event_path = Path(src_path)
+        self.handle_created(src_path)
 
+    def handle_modified(self, src_path: str) -> None:
+        """Read new lines if the modified file is the monitored log.
+
+        Args:
+            src_path: Path of the modified file.
+        """
+        with self._lock:
+            # The date can only change at midnight, so a float compare is enough
+            if time.time() >= self._next_midnight_epoch:
+                self._next_midnight_epoch = _compute_next_midnight()
+                self._check_date_change()
+
+            if os.path.normcase(src_path) != self._target_str:
+                return
+
+            if self._debounce_seconds <= 0:
+                self._read_new_lines()
+            elif not self._read_pending and not self._closed:
+                self._read_pending = True
+                if self._debounce_thread is None:
+                    self._debounce_thread = threading.Thread(
+                        target=self._debounce_loop,
+                        name="AlertDebounceReader",
+                        daemon=True,
+                    )
+                    self._debounce_thread.start()
+                self._read_wakeup.notify()
+
+    def _debounce_loop(self) -> None:
+        """Run debounced reads until the handler is closed.
+
+        Waits for a pending read, lets the rest of the burst arrive for the
+        debounce window, then reads once.
+        """
+        with self._lock:
+            while not self._closed:
+                if not self._read_pending:
+                    self._read_wakeup.wait()
+                    continue
+
+                deadline = time.monotonic() + self._debounce_seconds
+                while not self._closed and (left := deadline - time.monotonic()) > 0:
+                    self._read_wakeup.wait(left)
+                self._flush_pending_read()
+
+    def _flush_pending_read(self) -> None:
+        """Run the read scheduled by a debounced modify event, unless closed."""
+        with self._lock:
+            if self._closed or not self._read_pending:
+                return
+            self._read_pending = False
+            self._read_new_lines()
+
+    def handle_created(self, src_path: str) -> None:
+        """Switch to a newly created log file in the monitored directory.
+
+        Args:
+            src_path: Path of the created file.
+        """
         # Check if this is a new .log file in the monitored directory
-        if (
-            self.auto_switch_date
-            and event_path.suffix == ".log"
-            and event_path.parent == self._monitor_directory
-        ):
+        if not self.auto_switch_date or not src_path.endswith(".log"):
+            return
+
+        directory, name = os.path.split(src_path)
+        if os.path.normcase(directory) != self._monitor_dir_str:
+            return
+
+        new_st = _stat_or_none(src_path)
+        if new_st is None:
+            return
+
+        with self._lock:
             # Check if this new file is newer than current file
-            if not self.file_path.exists() or event_path.stat().st_mtime > self.file_path.stat().st_mtime:
-                logger.info(f"New log file created, switching to: {event_path.name}")
-                self.file_path = event_path
-                self._last_position = 0
+            current_st = _stat_or_none(self.file_path)
+            if current_st is None or new_st.st_mtime > current_st.st_mtime:
+                logger.info(f"New log file created, switching to: {name}")
+                self.switch_to(Path(src_path))
                 self._current_date = date.today()
 
+    def switch_to(self, new_path: Path, position: int = 0) -> None:
+        """Switch monitoring to another log file, e.g. after rotation.
+
+        Complete lines still unread in the current file are delivered first,
+        so alerts written just before the rotation are not lost.
+
+        Args:
+            new_path: Log file to monitor from now on.
+            position: Byte offset in the new file to start reading from.
+        """
+        with self._lock:
+            # The pending debounced read is done here, on the old file
+            self._read_pending = False
+            self._read_new_lines()
+
+            self._close_file()
+            self.file_path = new_path
+            self._last_position = position
+
+    def _open_file(self) -> Optional[int]:
+        """Open the monitored file and position it at the last read offset.
+
+        Returns:
+            File descriptor, or None if the file does not exist yet.
+        """
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            return None
+
+        os.lseek(fd, self._last_position, os.SEEK_SET)
+        self._fd = fd
+        self._released_position = 0
+
+        # Append-only log read front to back: let the kernel read ahead
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return fd
+
+    def _release_read_pages(self, fd: int) -> None:
+        """Drop page-cache pages for the part of the file already consumed.
+
+        Args:
+            fd: Open file descriptor of the monitored file.
+        """
+        if self._last_position - self._released_position < FADVISE_DONTNEED_BYTES:
+            return
+
+        try:
+            os.posix_fadvise(fd, 0, self._last_position, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            return
+        self._released_position = self._last_position
+
+    def _close_file(self) -> None:
+        """Close the monitored file and drop any buffered partial line."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._tail.clear()
+
+    def close(self) -> None:
+        """Drop any pending debounced read and release the file descriptor.
+
+        Waits for a read already in progress. No read runs after this
+        returns, so the file is never reopened and no line is delivered late.
+        A closed handler cannot be reused; create a new one instead.
+        """
+        with self._lock:
+            self._closed = True
+            self._read_pending = False
+            self._read_wakeup.notify()
+            self._close_file()
+            thread = self._debounce_thread
+            self._debounce_thread = None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _iter_complete_lines(self, fd: int) -> Iterator[str]:
+        """Read the file in fixed-size chunks and yield complete lines.
+
+        Backslash continuations are joined before splitting. Bytes after the
+        last newline, or after the last newline that is not escaped by a
+        backslash, stay in the tail buffer for the next call.
+
+        Args:
+            fd: Open file descriptor of the monitored file.
+
+        Yields:
+            Decoded non-blank lines with surrounding whitespace removed.
+        """
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            self._last_position += len(chunk)
+            self._tail += chunk
+
+            end = self._tail.rfind(b"\n") + 1
+            if not end:
+                continue
+
+            # Fast path: alerts rarely use continuations, so skip both passes
+            # unless a backslash is actually buffered
+            complete: Optional[bytes]
+            if self._tail.find(b"\\", 0, end) == -1:
+                complete = bytes(self._tail[:end])
+                del self._tail[:end]
+            else:
+                complete = self._join_continuations(end)
+                if complete is None:
+                    continue
+
+            # One decode per chunk, then a single C-level scan trims each line
+            # and skips blank ones; only complete lines are ever decoded
+            for match in _LINE_RE.finditer(complete.decode("utf-8", "replace")):
+                yield match.group()
+
+    def _join_continuations(self, end: int) -> Optional[bytes]:
+        """Detach complete lines from the tail and join backslash continuations.
+
+        Lines whose continuation has not arrived yet stay in the tail buffer.
+
+        Args:
+            end: Offset just past the last newline in the tail buffer.
+
+        Returns:
+            Complete lines with continuations joined, or None if every
+            buffered line is still waiting for its continuation.
+        """
+        # Hold back lines whose continuation has not arrived yet
+        while end:
+            start = self._tail.rfind(b"\n", 0, end - 1) + 1
+            if not self._tail[start : end - 1].rstrip(b" \t\r").endswith(b"\\"):
+                break
+            end = start
+        if not end:
+            return None
+
+        # Detach complete lines first so a failing callback cannot replay them
+        complete, merged = _CONTINUATION_RE.subn(b"", self._tail[:end])
+        del self._tail[:end]
+        if merged:
+            logger.debug("Line continuation detected - %d line(s) merged", merged)
+        return complete
+
     def _read_new_lines(self) -> None:
         """Read new lines from file since last position.
 
-        Lines ending with backslash (\\) are joined with the next line.
+        The file descriptor stays open between calls; an incomplete last
+        line is buffered until its newline arrives.
+        Lines ending with backslash (\\) are joined with the next line,
+        which may arrive in a later read.
         """
+        if self._closed:
+            return
+
         try:
-            if not self.file_path.exists():
+            fd = self._fd if self._fd is not None else self._open_file()
+            if fd is None:
                 return
 
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                f.seek(self._last_position)
-                new_content = f.read()
-                self._last_position = f.tell()
+            # Start over if the file was truncated
+            if os.fstat(fd).st_size < self._last_position:
+                logger.info("Log file truncated, rereading: %s", self.file_path.name)
+                self._close_file()
+                self._last_position = 0
+                fd = self._open_file()
+                if fd is None:
+                    return
+
+            # Checked once per read; the level can change between reads
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if self.batch_callback is not None:
+                lines = list(self._iter_complete_lines(fd))
+                if debug_enabled:
+                    for line in lines:
+                        logger.debug("New alert line: %s", line)
+                if lines:
+                    self.batch_callback(lines)
+            elif self.callback is not None:
+                for line in self._iter_complete_lines(fd):
+                    if debug_enabled:
+                        logger.debug("New alert line: %s", line)
+                    self.callback(line)
+
+            if hasattr(os, "posix_fadvise"):
+                self._release_read_pages(fd)
 
-            if new_content:
-                # Split into lines and merge lines ending with backslash
-                raw_lines = new_content.strip().split("\n")
-                merged_lines = []
-                i = 0
+        except Exception as e:
+            logger.error("Error reading alert file: %s", e)
 
-                while i < len(raw_lines):
-                    line = raw_lines[i].rstrip()
 
-                    # Check if line continuation is needed
-                    needs_merge = line.endswith("\\") and i + 1 < len(raw_lines)
+class _InotifyObserver(threading.Thread):
+    """Tail loop driven by inotify events on the alert log.
 
-                    # Join lines ending with backslash
-                    while line.endswith("\\") and i + 1 < len(raw_lines):
-                        line = line[:-1]  # Remove trailing backslash
-                        i += 1
-                        line += raw_lines[i].strip()  # Append next line
+    Modify events are watched on the monitored file only, so writes to the
+    other logs in the directory never wake the loop. The directory itself is
+    watched for file creation only, to pick up the daily rollover.
 
-                    # Debug output for merged lines
-                    if needs_merge:
-                        logger.debug(f"Line continuation detected - Merged line: {line}")
+    Blocks in select() on the inotify fd, so nothing runs until the kernel
+    reports a change. Exposes the same start/stop/join/is_alive interface
+    as the watchdog Observer.
+    """
 
-                    merged_lines.append(line)
-                    i += 1
+    def __init__(self, handler: AlertFileHandler, directory: Path):
+        """Initialize observer and register the watches.
 
-                # Process merged lines
-                for line in merged_lines:
-                    if line:
-                        logger.debug(f"New alert line: {line}")
-                        self.callback(line)
+        Args:
+            handler: Handler receiving modification/creation events.
+            directory: Directory containing the alert log files.
+        """
+        super().__init__(name="AlertInotifyObserver", daemon=True)
+        self._handler = handler
+        self._directory = str(directory)
+        self._inotify = INotify()
+        self._dir_wd = self._inotify.add_watch(
+            self._directory, inotify_flags.CREATE | inotify_flags.MOVED_TO
+        )
+        self._file_wd: Optional[int] = None
+        self._watched_path: Optional[Path] = None
+        self._watch_file()
+        self._wake_r, wake_w = os.pipe()
+        self._wake_w: Optional[int] = wake_w
 
+    def _watch_file(self) -> bool:
+        """Move the modify watch to the handler's current log file.
+
+        Returns:
+            True if a new watch was added, False if unchanged or not possible.
+        """
+        target = self._handler.file_path
+        if self._file_wd is not None and target == self._watched_path:
+            return False
+
+        if self._file_wd is not None:
+            try:
+                self._inotify.rm_watch(self._file_wd)
+            except OSError:
+                pass  # Already removed by the kernel (file deleted)
+            self._file_wd = None
+
+        try:
+            self._file_wd = self._inotify.add_watch(str(target), inotify_flags.MODIFY)
+        except OSError:
+            # Not created yet, the directory watch will report it
+            return False
+
+        self._watched_path = target
+        return True
+
+    def run(self) -> None:
+        """Dispatch inotify events until stop() is called."""
+        try:
+            while True:
+                readable, _, _ = select.select([self._inotify, self._wake_r], [], [])
+                if self._wake_r in readable:
+                    break
+
+                for event in self._inotify.read(timeout=0):
+                    self._dispatch(event.wd, event.mask, event.name)
+
+                # Follow the handler if it switched to another log file, and
+                # catch up on anything written before the new watch existed
+                if self._watch_file():
+                    self._dispatch(self._file_wd, inotify_flags.MODIFY, "")
+        finally:
+            self._inotify.close()
+            os.close(self._wake_r)
+
+    def _dispatch(self, wd: Optional[int], mask: int, name: str) -> None:
+        """Forward a single inotify event to the handler.
+
+        Args:
+            wd: Watch descriptor the event was reported on.
+            mask: inotify event mask.
+            name: File name for directory events, empty for file events.
+        """
+        try:
+            if wd == self._file_wd:
+                if mask & inotify_flags.IGNORED:
+                    # Watched file was deleted, re-added once it reappears
+                    self._file_wd = None
+                elif mask & inotify_flags.MODIFY:
+                    self._handler.handle_modified(str(self._watched_path))
+            elif wd == self._dir_wd and name:
+                self._handler.handle_created(os.path.join(self._directory, name))
         except Exception as e:
-            logger.error(f"Error reading alert file: {e}")
+            logger.error(f"Error handling inotify event for {name or wd}: {e}")
+
+    def stop(self) -> None:
+        """Wake up the event loop and make it exit."""
+        if self._wake_w is not None:
+            # Closing the write end makes the read end readable (EOF)
+            os.close(self._wake_w)
+            self._wake_w = None
 
 
 class AlertMonitor:
@@ -272,6 +753,8 @@ class AlertMonitor:
         alert_log_path: str | Path,
         callback: Callable[[str], None],
         auto_resolve_date: bool = True,
+        backend: str = "auto",
+        symbol_filter: Optional[frozenset[str]] = None,
     ):
         """Initialize alert monitor.
 
@@ -280,35 +763,79 @@ class AlertMonitor:
                 Supports {date} placeholder and directory auto-detection.
             callback: Function to call when new alert detected.
             auto_resolve_date: Auto-resolve {date} placeholder and detect latest log.
+            backend: File event source: "inotify", "watchdog", or "auto" to use
+                inotify when available and watchdog otherwise.
+            symbol_filter: Symbols to pass on. Entry alerts for any other
+                symbol are dropped before reaching the callback. None or empty
+                passes every line.
+
+        Raises:
+            ValueError: If the backend is unknown or not available.
         """
+        if backend not in ("auto", "inotify", "watchdog"):
+            raise ValueError(f"Unknown monitor backend: {backend}")
+        if backend == "inotify" and not INOTIFY_AVAILABLE:
+            raise ValueError("inotify backend requires inotify_simple on Linux")
+        self.backend = backend
+
         if auto_resolve_date:
             self.alert_log_path = resolve_log_path(alert_log_path)
         else:
             self.alert_log_path = Path(alert_log_path)
 
         self.callback = callback
+        self.symbol_filter = symbol_filter
         self._observer: Any = None
         self._handler: Optional[AlertFileHandler] = None
 
+        # Lines are handed to a worker so a slow callback never stalls the reader.
+        # Single producer and single consumer: deque append/popleft are atomic,
+        # so the reader takes no lock per line, and maxlen drops the oldest line
+        self._lines: deque[str] = deque(maxlen=LINE_QUEUE_MAXSIZE)
+        self._lines_ready = threading.Event()
+        # Set once the reader is closed; a flag rather than a queued sentinel,
+        # which would evict the oldest line from a full queue
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+
     def start(self) -> None:
         """Start monitoring alert log file."""
-        if not self.alert_log_path.exists():
+        # Single stat for both the existence check and the initial position
+        st = _stat_or_none(self.alert_log_path)
+        initial_position = st.st_size if st else 0
+        if st is None:
             logger.warning(
                 f"Alert log file not found: {self.alert_log_path}. "
                 "Waiting for file creation..."
             )
 
+        self._stopping = False
+        self._worker = threading.Thread(
+            target=self._drain_lines, name="AlertCallbackWorker", daemon=True
+        )
+        self._worker.start()
+
         self._handler = AlertFileHandler(
             self.alert_log_path,
-            self.callback,
             auto_switch_date=True,
+            initial_position=initial_position,
+            debounce_seconds=READ_DEBOUNCE_SECONDS,
+            batch_callback=self._enqueue_lines,
         )
-        self._observer = Observer()
-        self._observer.schedule(
-            self._handler,
-            str(self.alert_log_path.parent),
-            recursive=False,
+        use_inotify = self.backend == "inotify" or (
+            self.backend == "auto" and INOTIFY_AVAILABLE
         )
+        if use_inotify:
+            self._observer = _InotifyObserver(self._handler, self.alert_log_path.parent)
+        else:
+            from watchdog.observers import Observer
+
+            self._observer = Observer()
+            self._observer.schedule(
+                self._handler,
+                str(self.alert_log_path.parent),
+                recursive=False,
+            )
         self._observer.start()
 
         logger.info(f"Started monitoring: {self.alert_log_path}")
@@ -321,6 +848,65 @@ class AlertMonitor:
             self._observer = None
             logger.info("Stopped alert monitoring")
 
+        if self._handler:
+            self._handler.close()
+
+        if self._worker:
+            # Lines already queued are delivered before the worker exits
+            self._stopping = True
+            self._lines_ready.set()
+            self._worker.join()
+            self._worker = None
+
+    def _enqueue_lines(self, new_lines: list[str]) -> None:
+        """Queue a batch of lines for the callback worker with one wakeup.
+
+        The oldest queued lines are dropped if the queue overflows.
+
+        Args:
+            new_lines: Alert lines read from the log file in one read.
+        """
+        # Drop entry alerts for other symbols before they cost a queue slot,
+        # a worker wakeup and a full parse
+        if self.symbol_filter:
+            symbol_filter = self.symbol_filter
+            match = _ENTRY_SYMBOL_RE.match
+            new_lines = [
+                line
+                for line in new_lines
+                if not (m := match(line)) or m.group(1).upper() in symbol_filter
+            ]
+            if not new_lines:
+                return
+
+        lines = self._lines
+        if lines.maxlen is not None:
+            overflow = len(lines) + len(new_lines) - lines.maxlen
+            if overflow > 0:
+                logger.warning("Alert queue full, dropping %d oldest line(s)", overflow)
+        lines.extend(new_lines)
+        self._lines_ready.set()
+
+    def _drain_lines(self) -> None:
+        """Deliver queued lines to the callback until stop() is called."""
+        lines = self._lines
+        while True:
+            self._lines_ready.wait()
+            # Cleared before draining, so a line appended meanwhile either gets
+            # drained now or sets the event again for the next round
+            self._lines_ready.clear()
+            # Read before draining: stop() sets it only after the reader is
+            # closed, so every line is already queued once it is seen
+            stopping = self._stopping
+            while lines:
+                line = lines.popleft()
+                try:
+                    self.callback(line)
+                except Exception as e:
+                    logger.error("Error in alert callback: %s", e)
+            if stopping:
+                return
+
     def is_running(self) -> bool:
         """Check if monitor is running.
 
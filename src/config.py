@@ -1,13 +1,37 @@
 """Configuration management module."""
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
 
+@functools.lru_cache(maxsize=4)
+def _load_yaml(path: str, file_key: tuple[int, int, int]) -> Any:
+    """Parse a YAML file, cached until the file changes.
 
-@dataclass
+    Args:
+        path: Path to YAML file.
+        file_key: (st_mtime_ns, st_size, st_ino) of the file, only used as
+            part of the cache key. Size and inode catch a rewrite or a
+            rename within one mtime tick.
+
+    Returns:
+        Parsed YAML document. Shared between calls, so it must not be mutated.
+    """
+    # Imported here so CLI paths that never load a config skip it
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    # Binary stream: the loader detects the UTF-8/16 encoding itself and
+    # libyaml decodes it natively, skipping a Python-level text decode
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
+@dataclass(frozen=True, slots=True)
 class SymbolConfig:
     """Configuration for a trading symbol."""
 
@@ -16,23 +40,24 @@ class SymbolConfig:
     weekend_stop: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MT4Config:
     """MT4 configuration."""
 
     alert_log_path: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MT5Config:
     """MT5 configuration."""
 
     login: int = 0
     password: str = ""
     server: str = ""
+    terminal_path: str = ""  # terminal64.exe to attach to; empty uses the default
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradeControlConfig:
     """Trade control configuration for MT4 EA integration."""
 
@@ -41,7 +66,7 @@ class TradeControlConfig:
     default_enabled: bool = True  # Default state when file not found
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TradingConfig:
     """Trading configuration."""
 
@@ -49,7 +74,7 @@ class TradingConfig:
     max_execution_delay_seconds: int = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -69,6 +94,12 @@ class Config:
     trade_control: TradeControlConfig = field(default_factory=TradeControlConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, dropping cached symbol lookups when symbols change."""
+        super().__setattr__(name, value)
+        if name == "symbols":
+            self.__dict__.pop("enabled_symbol_set", None)
+
     @classmethod
     def from_yaml(cls, path: str | Path) -> "Config":
         """Load configuration from YAML file.
@@ -84,11 +115,12 @@ class Config:
             ValueError: If config file is invalid.
         """
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}") from None
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(str(path), (st.st_mtime_ns, st.st_size, st.st_ino))
 
         if not data:
             raise ValueError("Configuration file is empty")
@@ -110,8 +142,9 @@ class Config:
 
         # Symbols config
         if "symbols" in data:
+            # Interned so lookups with parser-interned names match by identity
             for symbol, symbol_data in data["symbols"].items():
-                config.symbols[symbol] = SymbolConfig(**symbol_data)
+                config.symbols[sys.intern(symbol)] = SymbolConfig(**symbol_data)
 
         # Trading config
         if "trading" in data:
@@ -135,6 +168,18 @@ class Config:
         """
         return [symbol for symbol, cfg in self.symbols.items() if cfg.enabled]
 
+    @functools.cached_property
+    def enabled_symbol_set(self) -> frozenset[str]:
+        """Enabled symbol names for O(1) membership tests.
+
+        Computed once and recomputed only when ``symbols`` is reassigned;
+        in-place changes to the symbols dict are not tracked.
+
+        Returns:
+            Frozenset of enabled symbol names.
+        """
+        return frozenset(self.get_enabled_symbols())
+
     def get_symbol_config(self, symbol: str) -> Optional[SymbolConfig]:
         """Get configuration for specific symbol.
 
@@ -1,17 +1,36 @@
 """Logging configuration module."""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# Background listener doing the actual console/file I/O, replaced on each setup
+_listener: Optional[QueueListener] = None
+_stop_registered = False
+
+
+def _stop_listener() -> None:
+    """Flush queued records and close the handlers owned by the listener."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
 
 def setup_logger(
     name: str = "monitoring_indicator",
     log_file: Optional[str] = None,
     level: int = logging.INFO,
+    background: bool = True,
 ) -> logging.Logger:
     """Set up and configure logger.
 
@@ -19,14 +38,22 @@ def setup_logger(
         name: Logger name.
         log_file: Path to log file. If None, logs only to console.
         level: Logging level.
+        background: Hand records to a queue on the calling thread and let a
+            background QueueListener format and write them. False writes
+            synchronously and starts no thread.
 
     Returns:
         Configured logger instance.
     """
+    global _listener, _stop_registered
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Clear existing handlers
+    # Clear existing handlers, draining the previous listener first
+    _stop_listener()
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Format
@@ -38,7 +65,7 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (if log_file specified)
     if log_file:
@@ -53,10 +80,25 @@ def setup_logger(
             encoding="utf-8",
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if not background:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    if not _stop_registered:
+        atexit.register(_stop_listener)
+        _stop_registered = True
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
 
 
-# Default logger instance
-logger = setup_logger()
+# Default logger instance; synchronous so importing starts no thread, until
+# the application calls setup_logger()
+logger = setup_logger(background=False)
@@ -1,9 +1,10 @@
 """Main entry point for MonitoringIndicator."""
 
 import argparse
+import select
 import signal
+import socket
 import sys
-import time
 from pathlib import Path
 from types import FrameType
 from typing import Optional
@@ -14,6 +15,10 @@ from .logger import logger, setup_logger
 from .order_executor import OrderExecutor
 from .signal_parser import SignalParser
 
+# select() without a timeout can't be interrupted by Ctrl+C on Windows, so the
+# main thread wakes up periodically there to let signal handlers run.
+SHUTDOWN_WAIT_TIMEOUT: Optional[float] = 1.0 if sys.platform == "win32" else None
+
 
 class MonitoringIndicator:
     """Main application class."""
@@ -36,8 +41,15 @@ class MonitoringIndicator:
         self.alert_monitor = AlertMonitor(
             self.config.mt4.alert_log_path,
             self._on_alert,
+            symbol_filter=self.config.enabled_symbol_set,
         )
-        self._running = False
+        # Set from the signal handler, so a plain flag rather than an Event:
+        # Event.set() takes a lock the interrupted main thread may be holding.
+        # The socket pair wakes the main loop; sockets so select() works on
+        # Windows too.
+        self._shutdown_requested = False
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_w.setblocking(False)
 
     def _setup_logging(self) -> None:
         """Set up logging based on configuration."""
@@ -56,15 +68,15 @@ class MonitoringIndicator:
         Args:
             message: Alert message from MT4.
         """
-        logger.debug(f"Received alert: {message}")
+        logger.debug("Received alert: %s", message)
 
         # Parse signal
         parsed_signal = self.signal_parser.parse(message)
         if not parsed_signal:
-            logger.debug(f"Ignored non-signal message: {message}")
+            logger.debug("Ignored non-signal message: %s", message)
             return
 
-        logger.info(f"Signal detected: {parsed_signal}")
+        logger.info("Signal detected: %s", parsed_signal)
 
         # In dry-run mode, just print to stdout
         if self.dry_run:
@@ -84,9 +96,9 @@ class MonitoringIndicator:
             result = self.order_executor.execute(parsed_signal)
 
             if result.success:
-                logger.info(f"Order successful: Ticket={result.order_ticket}")
+                logger.info("Order successful: Ticket=%s", result.order_ticket)
             else:
-                logger.warning(f"Order failed: {result.error_message}")
+                logger.warning("Order failed: %s", result.error_message)
 
     def start(self) -> None:
         """Start the monitoring system."""
@@ -108,7 +120,6 @@ class MonitoringIndicator:
 
         # Start alert monitoring
         self.alert_monitor.start()
-        self._running = True
 
         logger.info("MonitoringIndicator started successfully")
         logger.info(f"Monitoring symbols: {self.config.get_enabled_symbols()}")
@@ -116,7 +127,6 @@ class MonitoringIndicator:
     def stop(self) -> None:
         """Stop the monitoring system."""
         logger.info("Stopping MonitoringIndicator...")
-        self._running = False
 
         self.alert_monitor.stop()
         if self.order_executor:
@@ -124,17 +134,34 @@ class MonitoringIndicator:
 
         logger.info("MonitoringIndicator stopped")
 
+    def request_shutdown(self) -> None:
+        """Ask the main loop to exit; safe to call from a signal handler."""
+        self._shutdown_requested = True
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass  # Buffer full or run() already exited
+
     def run(self) -> None:
-        """Run the main loop."""
+        """Run the main loop until shutdown is requested.
+
+        A shutdown requested while starting up (e.g. during the MT5 connect)
+        is honoured as soon as start() returns.
+        """
         self.start()
 
         try:
-            while self._running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Keyboard interrupt received")
+            while not self._shutdown_requested:
+                readable, _, _ = select.select(
+                    [self._wakeup_r], [], [], SHUTDOWN_WAIT_TIMEOUT
+                )
+                if readable:
+                    self._wakeup_r.recv(64)
         finally:
             self.stop()
+            # A late request_shutdown() then gets OSError and ignores it
+            self._wakeup_r.close()
+            self._wakeup_w.close()
 
 
 def main() -> None:
@@ -160,8 +187,10 @@ def main() -> None:
     def signal_handler(signum: int, frame: Optional[FrameType]) -> None:
         logger.info(f"Received signal {signum}")
         if app:
-            app.stop()
-        sys.exit(0)
+            # run() returns and stops the app from the main thread
+            app.request_shutdown()
+        else:
+            sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -1,8 +1,11 @@
 """MT5 order execution module."""
 
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
 from .config import Config, SymbolConfig
 from .logger import logger
@@ -19,7 +22,7 @@ except ImportError:
     mt5 = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderResult:
     """Result of order execution."""
 
@@ -30,17 +33,37 @@ class OrderResult:
     closed_count: int = 0  # Number of positions closed (for close signals)
 
 
+# OrderResult is immutable, so the fixed rejections are built once and shared
+_TRADE_DISABLED_RESULT = OrderResult(
+    success=False, error_message="Trade disabled by MT4 control"
+)
+_DUPLICATE_RESULT = OrderResult(
+    success=False, error_message="Duplicate signal within threshold"
+)
+_TRADING_NOT_ALLOWED_RESULT = OrderResult(
+    success=False, error_message="Trading not allowed at this time"
+)
+_NOT_CONNECTED_RESULT = OrderResult(success=False, error_message="Not connected to MT5")
+
+
 class DuplicateChecker:
     """Check for duplicate signals within threshold."""
 
-    def __init__(self, threshold_seconds: int = 180):
+    def __init__(self, threshold_seconds: int = 180, max_entries: int = 1024):
         """Initialize duplicate checker.
 
         Args:
             threshold_seconds: Time threshold in seconds for duplicate detection.
+            max_entries: Maximum number of (symbol, action) keys remembered;
+                the least recently seen key is evicted beyond this.
         """
         self.threshold_seconds = threshold_seconds
-        self._last_signals: dict[str, datetime] = {}
+        self.max_entries = max_entries
+        self._threshold_ns = threshold_seconds * 1_000_000_000
+        # Ordered by last sighting, oldest first; values are monotonic_ns()
+        self._last_signals: OrderedDict[tuple[str, SignalAction], int] = OrderedDict()
+        # execute() may be called from more than one thread
+        self._lock = threading.Lock()
 
     def is_duplicate(self, signal: Signal) -> bool:
         """Check if signal is a duplicate.
@@ -51,20 +74,59 @@ class DuplicateChecker:
         Returns:
             True if duplicate, False otherwise.
         """
-        key = f"{signal.symbol}_{signal.action.value}"
-        now = datetime.now()
+        key = (signal.symbol, signal.action)
+        now = time.monotonic_ns()
 
-        if key in self._last_signals:
-            last_time = self._last_signals[key]
-            if now - last_time < timedelta(seconds=self.threshold_seconds):
+        with self._lock:
+            last_time = self._last_signals.get(key)
+            if last_time is not None and now - last_time < self._threshold_ns:
                 return True
 
-        self._last_signals[key] = now
-        return False
+            self._last_signals[key] = now
+            self._last_signals.move_to_end(key)
+            self._sweep_locked(now)
+            if len(self._last_signals) > self.max_entries:
+                self._last_signals.popitem(last=False)
+            return False
+
+    def sweep(self, now_ns: Optional[int] = None) -> int:
+        """Forget signals whose threshold window has already passed.
+
+        Args:
+            now_ns: Current time from time.monotonic_ns(); taken if omitted.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            return self._sweep_locked(time.monotonic_ns() if now_ns is None else now_ns)
+
+    def _sweep_locked(self, now_ns: int) -> int:
+        """Drop expired entries from the front; caller must hold the lock.
+
+        Entries are kept in last-seen order, so expired ones are always at
+        the front and the sweep stops at the first entry still in its window.
+
+        Args:
+            now_ns: Current time from time.monotonic_ns().
+
+        Returns:
+            Number of entries removed.
+        """
+        cutoff = now_ns - self._threshold_ns
+        removed = 0
+        while self._last_signals:
+            oldest_key = next(iter(self._last_signals))
+            if self._last_signals[oldest_key] > cutoff:
+                break
+            del self._last_signals[oldest_key]
+            removed += 1
+        return removed
 
     def clear(self) -> None:
         """Clear all recorded signals."""
-        self._last_signals.clear()
+        with self._lock:
+            self._last_signals.clear()
 
 
 class TradingTimeChecker:
@@ -77,9 +139,8 @@ class TradingTimeChecker:
         Returns:
             True if weekend, False otherwise.
         """
-        now = datetime.now()
-        # weekday(): Monday=0, Sunday=6
-        return now.weekday() >= 5
+        # tm_wday: Monday=0, Sunday=6; avoids building a datetime per check
+        return time.localtime().tm_wday >= 5
 
     def can_trade(self, symbol: str, symbol_config: SymbolConfig) -> bool:
         """Check if trading is allowed for symbol.
@@ -95,31 +156,56 @@ class TradingTimeChecker:
             return False
 
         if symbol_config.weekend_stop and self.is_weekend():
-            logger.info(f"Trading disabled for {symbol} during weekend")
+            logger.info("Trading disabled for %s during weekend", symbol)
             return False
 
         return True
 
 
+# Stateless, so every executor shares one instance
+_TIME_CHECKER = TradingTimeChecker()
+
+
 class OrderExecutor:
     """Execute orders on MT5."""
 
-    def __init__(self, config: Config):
+    def __init__(
+        self, config: Config, trade_controller: Optional[TradeController] = None
+    ):
         """Initialize order executor.
 
         Args:
             config: Application configuration.
+            trade_controller: Trade controller to consult before each order.
+                When None, one is created from ``config.trade_control`` if
+                that is enabled.
         """
         self.config = config
         self.duplicate_checker = DuplicateChecker(
             config.trading.duplicate_threshold_seconds
         )
-        self.time_checker = TradingTimeChecker()
+        self.time_checker = _TIME_CHECKER
         self._connected = False
 
+        # Per-session caches of MT5 symbol metadata (each lookup is an IPC call)
+        self._symbol_info_cache: dict[str, Any] = {}
+        self._selected: set[str] = set()
+        # Price precision of each selected symbol, used to round SL/TP
+        self._digits: dict[str, int] = {}
+
+        # Built on first order
+        self._order_template: Optional[dict[str, Any]] = None
+        # True if connect() started the controller's watcher; a controller
+        # shared with other executors may already be watched by one of them
+        self._owns_watcher = False
+
         # Initialize trade controller if enabled
-        self.trade_controller: TradeController | None = None
-        if config.trade_control.enabled and config.trade_control.control_file_path:
+        self.trade_controller: TradeController | None = trade_controller
+        if (
+            trade_controller is None
+            and config.trade_control.enabled
+            and config.trade_control.control_file_path
+        ):
             self.trade_controller = TradeController(
                 config.trade_control.control_file_path
             )
@@ -140,7 +226,13 @@ class OrderExecutor:
             logger.error("MetaTrader5 package not available (Windows only)")
             return False
 
-        if not mt5.initialize():
+        # Pinning the terminal lets several instances each drive their own
+        # terminal instead of sharing one order pipe
+        terminal_path = self.config.mt5.terminal_path
+        initialized = (
+            mt5.initialize(path=terminal_path) if terminal_path else mt5.initialize()
+        )
+        if not initialized:
             logger.error(f"MT5 initialization failed: {mt5.last_error()}")
             return False
 
@@ -157,13 +249,31 @@ class OrderExecutor:
 
         self._connected = True
         logger.info(f"Connected to MT5: {self.config.mt5.server}")
+
+        # Watch the control file in the background so execute() only reads a
+        # flag, unless another owner of a shared controller already does
+        if self.trade_controller and not self.trade_controller.is_watching:
+            self.trade_controller.start_watching()
+            self._owns_watcher = True
+
+        # Warm the symbol caches so the first order doesn't pay for them
+        for symbol in self.config.get_enabled_symbols():
+            if error := self._ensure_selected(symbol):
+                logger.warning(error)
         return True
 
     def disconnect(self) -> None:
         """Disconnect from MT5 terminal."""
+        if self._owns_watcher and self.trade_controller:
+            self.trade_controller.stop_watching()
+            self._owns_watcher = False
+
         if MT5_AVAILABLE and self._connected:
             mt5.shutdown()
             self._connected = False
+            self._symbol_info_cache.clear()
+            self._selected.clear()
+            self._digits.clear()
             logger.info("Disconnected from MT5")
 
     def is_connected(self) -> bool:
@@ -174,6 +284,45 @@ class OrderExecutor:
         """
         return self._connected
 
+    def _get_symbol_info(self, symbol: str) -> Any:
+        """Get symbol info, fetching it from MT5 only on first use.
+
+        Args:
+            symbol: Symbol name.
+
+        Returns:
+            MT5 SymbolInfo, or None if the symbol is unknown to the terminal.
+        """
+        info = self._symbol_info_cache.get(symbol)
+        if info is None:
+            info = mt5.symbol_info(symbol)
+            if info is not None:
+                self._symbol_info_cache[symbol] = info
+        return info
+
+    def _ensure_selected(self, symbol: str) -> Optional[str]:
+        """Make sure the symbol is known and shown in Market Watch.
+
+        Args:
+            symbol: Symbol name.
+
+        Returns:
+            Error message on failure, None if the symbol is ready for trading.
+        """
+        if symbol in self._selected:
+            return None
+
+        symbol_info = self._get_symbol_info(symbol)
+        if symbol_info is None:
+            return f"Symbol not found: {symbol}"
+
+        if not symbol_info.visible and not mt5.symbol_select(symbol, True):
+            return f"Failed to select symbol: {symbol}"
+
+        self._digits[symbol] = symbol_info.digits
+        self._selected.add(symbol)
+        return None
+
     def execute(self, signal: Signal) -> OrderResult:
         """Execute order based on signal.
 
@@ -183,26 +332,16 @@ class OrderExecutor:
         Returns:
             OrderResult with execution details.
         """
-        # Check trade control flag from MT4 EA
-        if self.trade_controller and not self.trade_controller.is_trade_enabled():
-            logger.info(f"Trade disabled by MT4 EA, signal ignored: {signal}")
-            return OrderResult(
-                success=False,
-                error_message="Trade disabled by MT4 control",
-            )
-
-        # Check duplicate
-        if self.duplicate_checker.is_duplicate(signal):
-            logger.warning(f"Duplicate signal ignored: {signal}")
-            return OrderResult(
-                success=False,
-                error_message="Duplicate signal within threshold",
-            )
+        # Cheapest checks first. The duplicate check goes last because it
+        # records the signal, so rejected signals are not remembered as seen
+        if not self._connected:
+            logger.error("Not connected to MT5")
+            return _NOT_CONNECTED_RESULT
 
         # Check symbol config
         symbol_config = self.config.get_symbol_config(signal.symbol)
         if not symbol_config:
-            logger.warning(f"Unknown symbol: {signal.symbol}")
+            logger.warning("Unknown symbol: %s", signal.symbol)
             return OrderResult(
                 success=False,
                 error_message=f"Unknown symbol: {signal.symbol}",
@@ -210,18 +349,18 @@ class OrderExecutor:
 
         # Check trading time
         if not self.time_checker.can_trade(signal.symbol, symbol_config):
-            return OrderResult(
-                success=False,
-                error_message="Trading not allowed at this time",
-            )
+            return _TRADING_NOT_ALLOWED_RESULT
 
-        # Check connection
-        if not self._connected:
-            logger.error("Not connected to MT5")
-            return OrderResult(
-                success=False,
-                error_message="Not connected to MT5",
-            )
+        # Check trade control flag from MT4 EA (served from the watcher's cached
+        # state while it runs)
+        if self.trade_controller and not self.trade_controller.is_trade_enabled():
+            logger.info("Trade disabled by MT4 EA, signal ignored: %s", signal)
+            return _TRADE_DISABLED_RESULT
+
+        # Check duplicate
+        if self.duplicate_checker.is_duplicate(signal):
+            logger.warning("Duplicate signal ignored: %s", signal)
+            return _DUPLICATE_RESULT
 
         # Route to appropriate handler
         if signal.is_close_signal():
@@ -229,6 +368,26 @@ class OrderExecutor:
         else:
             return self._send_order(signal, symbol_config)
 
+    def _get_order_template(self) -> dict[str, Any]:
+        """Get the request fields shared by every order.
+
+        Built on first use because the MT5 constants are only available
+        once the MetaTrader5 package has been imported.
+
+        Returns:
+            Dict of constant order request fields.
+        """
+        if self._order_template is None:
+            self._order_template = {
+                "action": mt5.TRADE_ACTION_DEAL,
+                "deviation": 20,
+                "magic": 123456,
+                "comment": "MonitoringIndicator",
+                "type_time": mt5.ORDER_TIME_GTC,
+                "type_filling": mt5.ORDER_FILLING_IOC,
+            }
+        return self._order_template
+
     def _send_order(
         self,
         signal: Signal,
@@ -249,44 +408,49 @@ class OrderExecutor:
                 error_message="MT5 not available",
             )
 
-        # Get symbol info
-        symbol_info = mt5.symbol_info(signal.symbol)
-        if symbol_info is None:
+        # Symbol info and selection are cached for the session
+        error = self._ensure_selected(signal.symbol)
+        if error:
             return OrderResult(
                 success=False,
-                error_message=f"Symbol not found: {signal.symbol}",
+                error_message=error,
             )
 
-        if not symbol_info.visible:
-            if not mt5.symbol_select(signal.symbol, True):
-                return OrderResult(
-                    success=False,
-                    error_message=f"Failed to select symbol: {signal.symbol}",
-                )
+        # Prices change, so the tick is always fetched (once)
+        tick = mt5.symbol_info_tick(signal.symbol)
+        if tick is None:
+            return OrderResult(
+                success=False,
+                error_message=f"Failed to get tick for {signal.symbol}",
+            )
 
         # Determine order type
         if signal.action == SignalAction.BUY:
-            order_type = mt5.ORDER_TYPE_BUY
-            price = mt5.symbol_info_tick(signal.symbol).ask
+            order_type, price = mt5.ORDER_TYPE_BUY, tick.ask
         else:
-            order_type = mt5.ORDER_TYPE_SELL
-            price = mt5.symbol_info_tick(signal.symbol).bid
-
-        # Prepare request
-        request = {
-            "action": mt5.TRADE_ACTION_DEAL,
-            "symbol": signal.symbol,
-            "volume": symbol_config.lot_size,
-            "type": order_type,
-            "price": price,
-            "sl": signal.stop_loss,
-            "tp": signal.take_profit,
-            "deviation": 20,
-            "magic": 123456,
-            "comment": "MonitoringIndicator",
-            "type_time": mt5.ORDER_TIME_GTC,
-            "type_filling": mt5.ORDER_FILLING_IOC,
-        }
+            order_type, price = mt5.ORDER_TYPE_SELL, tick.bid
+
+        # Alert prices may carry more decimals than the symbol allows, which
+        # the server rejects as invalid stops. _ensure_selected() above records
+        # the digits, so a symbol connect() did not warm is rounded the same
+        digits = self._digits[signal.symbol]
+        stop_loss = signal.stop_loss
+        take_profit = signal.take_profit
+        if stop_loss is not None:
+            stop_loss = round(stop_loss, digits)
+        if take_profit is not None:
+            take_profit = round(take_profit, digits)
+
+        # Prepare request from the constant fields plus the per-order ones
+        request = self._get_order_template().copy()
+        request.update(
+            symbol=signal.symbol,
+            volume=symbol_config.lot_size,
+            type=order_type,
+            price=price,
+            sl=stop_loss,
+            tp=take_profit,
+        )
 
         # Send order
         result = mt5.order_send(request)
@@ -300,8 +464,11 @@ class OrderExecutor:
             )
 
         logger.info(
-            f"Order executed: {signal.action.value} {signal.symbol} "
-            f"Lot:{symbol_config.lot_size} Ticket:{result.order}"
+            "Order executed: %s %s Lot:%s Ticket:%s",
+            signal.action.value,
+            signal.symbol,
+            symbol_config.lot_size,
+            result.order,
         )
 
         return OrderResult(
@@ -329,7 +496,7 @@ class OrderExecutor:
         positions = mt5.positions_get(symbol=signal.symbol)
 
         if positions is None or len(positions) == 0:
-            logger.info(f"No positions found for {signal.symbol}")
+            logger.info("No positions found for %s", signal.symbol)
             return OrderResult(
                 success=True,
                 error_message="No positions to close",
@@ -353,7 +520,9 @@ class OrderExecutor:
             position_type_name = (
                 "LONG" if signal.action == SignalAction.CLOSE_LONG else "SHORT"
             )
-            logger.info(f"No {position_type_name} positions found for {signal.symbol}")
+            logger.info(
+                "No %s positions found for %s", position_type_name, signal.symbol
+            )
             return OrderResult(
                 success=True,
                 error_message=f"No {position_type_name} positions to close",
@@ -361,6 +530,7 @@ class OrderExecutor:
             )
 
         # Close all matching positions
+        template = self._get_order_template()
         closed_count = 0
         errors = []
 
@@ -373,20 +543,16 @@ class OrderExecutor:
 
             price = tick.bid if close_type == mt5.ORDER_TYPE_SELL else tick.ask
 
-            # Prepare close request
-            request = {
-                "action": mt5.TRADE_ACTION_DEAL,
-                "symbol": signal.symbol,
-                "volume": position.volume,
-                "type": close_type,
-                "position": position.ticket,
-                "price": price,
-                "deviation": 20,
-                "magic": 123456,
-                "comment": "MonitoringIndicator Close",
-                "type_time": mt5.ORDER_TIME_GTC,
-                "type_filling": mt5.ORDER_FILLING_IOC,
-            }
+            # Prepare close request from the shared template
+            request = template.copy()
+            request.update(
+                symbol=signal.symbol,
+                volume=position.volume,
+                type=close_type,
+                position=position.ticket,
+                price=price,
+                comment="MonitoringIndicator Close",
+            )
 
             # Send close order
             result = mt5.order_send(request)
@@ -394,8 +560,10 @@ class OrderExecutor:
             if result.retcode == mt5.TRADE_RETCODE_DONE:
                 closed_count += 1
                 logger.info(
-                    f"Position closed: {signal.symbol} "
-                    f"Ticket:{position.ticket} Volume:{position.volume}"
+                    "Position closed: %s Ticket:%s Volume:%s",
+                    signal.symbol,
+                    position.ticket,
+                    position.volume,
                 )
             else:
                 error_msg = (
@@ -407,8 +575,10 @@ class OrderExecutor:
         # Return result
         if closed_count > 0:
             logger.info(
-                f"Closed {closed_count} positions for {signal.symbol} "
-                f"({signal.action.value})"
+                "Closed %d positions for %s (%s)",
+                closed_count,
+                signal.symbol,
+                signal.action.value,
             )
             return OrderResult(
                 success=True,
@@ -1,10 +1,11 @@
 """Signal parsing module for MT4 alert messages."""
 
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Final, Optional
 
 
 class SignalAction(Enum):
@@ -16,7 +17,7 @@ class SignalAction(Enum):
     CLOSE_SHORT = "ショート決済サイン"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Signal:
     """Parsed trading signal."""
 
@@ -45,21 +46,84 @@ class Signal:
         return self.action in (SignalAction.CLOSE_LONG, SignalAction.CLOSE_SHORT)
 
 
+def _is_price(text: str) -> bool:
+    """Check that text is digits with an optional fractional part.
+
+    Same shape as the regex number group, so float() always accepts it.
+
+    Args:
+        text: Candidate price text.
+
+    Returns:
+        True if text is a valid price, False otherwise.
+    """
+    whole, dot, frac = text.partition(".")
+    return text.isascii() and whole.isdigit() and (not dot or frac.isdigit())
+
+
+def _split_entry(message: str) -> Optional[tuple[str, str, str, str]]:
+    """Extract entry fields from a well-formed alert with plain string ops.
+
+    Handles the common "Ark_... BUY XAUUSD SL:1920.50 TP:1950.00" layout
+    without running the regex. Anything else returns None so the caller
+    can fall back to ENTRY_PATTERN.
+
+    Args:
+        message: Stripped alert message starting with the Ark_ prefix.
+
+    Returns:
+        (action, symbol, stop loss, take profit) texts, or None.
+    """
+    parts = message.split()
+    for i in range(1, len(parts) - 3):
+        # Length check first so only 3-4 char tokens get upper-cased
+        token = parts[i]
+        if len(token) not in (3, 4) or token.upper() not in ("BUY", "SELL"):
+            continue
+        sl, tp = parts[i + 2], parts[i + 3]
+        if (
+            sl[:3].upper() == "SL:"
+            and tp[:3].upper() == "TP:"
+            and _is_price(sl[3:])
+            and _is_price(tp[3:])
+        ):
+            return token, parts[i + 1], sl[3:], tp[3:]
+        break
+    return None
+
+
 class SignalParser:
     """Parser for MT4 alert messages."""
 
+    # Prices are captured only in a form float() always accepts, so the
+    # parse methods need no conversion error handling; the number must end the
+    # token, so "1950.0.5" or "1950abc" is rejected rather than cut short
+    _NUMBER: Final = r"(\d+(?:\.\d+)?)(?!\S)"
+
     # Entry pattern: Ark_BTC... BUY XAUUSD SL:1920.50 TP:1950.00
-    ENTRY_PATTERN = re.compile(
-        r'/(ショート|ロング)エントリーサイン（価格:\s*([\d.]+)）.*TP:\s*([\d.]+).*SL:\s*([\d.]+).*Symbol:\s*(XAUUSD|BTCUSD|ETHUSD)/u',
+    ENTRY_PATTERN: Final = re.compile(
+        rf"Ark_\S*.*?\b(BUY|SELL)\s+(\S+)\s+SL:\s*{_NUMBER}\s+TP:\s*{_NUMBER}",
         re.IGNORECASE,
     )
 
     # Close pattern: ロング決済サイン at price: 2650.50 or ショート決済サイン at price: 2650.50
-    CLOSE_PATTERN = re.compile(
-        r'(ショート|ロング)決済サイン（価格:\s*([\d.]+)）.*TP:\s*([\d.]+).*SL:\s*([\d.]+).*Symbol:\s*(XAUUSD|BTCUSD|ETHUSD)',
-        re.IGNORECASE,
+    CLOSE_PATTERN: Final = re.compile(
+        rf"(ロング|ショート)決済サイン\s+at\s+price:\s*{_NUMBER}"
     )
 
+    # Captured action text -> SignalAction (entry text is upper-cased first)
+    _ENTRY_ACTION_MAP: Final[dict[str, SignalAction]] = {
+        "BUY": SignalAction.BUY,
+        "SELL": SignalAction.SELL,
+    }
+    _CLOSE_ACTION_MAP: Final[dict[str, SignalAction]] = {
+        "ロング": SignalAction.CLOSE_LONG,
+        "ショート": SignalAction.CLOSE_SHORT,
+    }
+
+    # Only close alerts contain this keyword, so it selects the single pattern to run
+    CLOSE_KEYWORD: Final = "決済サイン"
+
     def __init__(self, valid_symbols: Optional[list[str]] = None):
         """Initialize parser.
 
@@ -67,6 +131,8 @@ class SignalParser:
             valid_symbols: List of valid symbol names. If None, all symbols accepted.
         """
         self.valid_symbols = valid_symbols
+        # Set for membership tests; the list is kept since its order matters
+        self._valid_symbol_set = frozenset(map(sys.intern, valid_symbols or ()))
 
     def parse(self, message: str) -> Optional[Signal]:
         """Parse alert message into Signal.
@@ -79,60 +145,92 @@ class SignalParser:
         """
         message = message.strip()
 
-        # Try entry pattern first
-        entry_signal = self._parse_entry(message)
-        if entry_signal:
-            return entry_signal
+        # Dispatch on a literal keyword (C-level substring search) so at most
+        # one regex is evaluated per message
+        if self.CLOSE_KEYWORD in message:
+            return self._parse_close(message)
+        return self._parse_entry(message)
+
+    def parse_many(self, messages: list[str]) -> list[Optional[Signal]]:
+        """Parse a batch of alert messages, e.g. when replaying a log.
 
-        # Try close pattern
-        close_signal = self._parse_close(message)
-        if close_signal:
-            return close_signal
+        All signals in the batch share one timestamp, taken when the batch
+        is parsed.
 
-        return None
+        Args:
+            messages: Alert message strings.
 
-    def _parse_entry(self, message: str) -> Optional[Signal]:
+        Returns:
+            Signal or None for each message, in the same order.
+        """
+        timestamp = datetime.now()
+        keyword = self.CLOSE_KEYWORD
+        parse_entry = self._parse_entry
+        parse_close = self._parse_close
+
+        results: list[Optional[Signal]] = []
+        append = results.append
+        for message in messages:
+            message = message.strip()
+            if keyword in message:
+                append(parse_close(message, timestamp))
+            else:
+                append(parse_entry(message, timestamp))
+        return results
+
+    def _parse_entry(
+        self, message: str, timestamp: Optional[datetime] = None
+    ) -> Optional[Signal]:
         """Parse entry signal message.
 
         Args:
             message: Alert message string.
+            timestamp: Signal timestamp. Defaults to the current time.
 
         Returns:
             Signal if valid entry signal, None otherwise.
         """
-        match = self.ENTRY_PATTERN.match(message)
-        if not match:
+        # Every entry alert starts with the Ark_ prefix; reject other log
+        # lines before any tokenizing or regex work
+        if message[:4].lower() != "ark_":
             return None
 
-        action_str, symbol, sl_str, tp_str = match.groups()
-
-        # Validate symbol
-        symbol = symbol.upper()
-        if self.valid_symbols and symbol not in self.valid_symbols:
+        # Plain split for the usual layout, regex for unusual spacing
+        fields = _split_entry(message)
+        if fields is not None:
+            action_str, symbol, sl_str, tp_str = fields
+        else:
+            match = self.ENTRY_PATTERN.match(message)
+            if not match:
+                return None
+            action_str, symbol, sl_str, tp_str = match.groups()
+
+        # Validate symbol; interned so the per-signal dict and set lookups
+        # downstream compare by identity with the interned config keys
+        symbol = sys.intern(symbol.upper())
+        if self._valid_symbol_set and symbol not in self._valid_symbol_set:
             return None
 
-        try:
-            action = (
-                SignalAction.BUY if action_str.upper() == "BUY" else SignalAction.SELL
-            )
-            stop_loss = float(sl_str)
-            take_profit = float(tp_str)
-        except (ValueError, KeyError):
+        action = self._ENTRY_ACTION_MAP.get(action_str.upper())
+        if action is None:
             return None
 
         return Signal(
             action=action,
             symbol=symbol,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            timestamp=datetime.now(),
+            stop_loss=float(sl_str),
+            take_profit=float(tp_str),
+            timestamp=timestamp or datetime.now(),
         )
 
-    def _parse_close(self, message: str) -> Optional[Signal]:
+    def _parse_close(
+        self, message: str, timestamp: Optional[datetime] = None
+    ) -> Optional[Signal]:
         """Parse close signal message.
 
         Args:
             message: Alert message string.
+            timestamp: Signal timestamp. Defaults to the current time.
 
         Returns:
             Signal if valid close signal, None otherwise.
@@ -143,13 +241,8 @@ class SignalParser:
 
         action_str, price_str = match.groups()
 
-        try:
-            if "ロング" in action_str:
-                action = SignalAction.CLOSE_LONG
-            else:
-                action = SignalAction.CLOSE_SHORT
-            close_price = float(price_str)
-        except (ValueError, KeyError):
+        action = self._CLOSE_ACTION_MAP.get(action_str)
+        if action is None:
             return None
 
         # For close signals, we need to determine the symbol from context
@@ -160,8 +253,8 @@ class SignalParser:
         return Signal(
             action=action,
             symbol=symbol,
-            close_price=close_price,
-            timestamp=datetime.now(),
+            close_price=float(price_str),
+            timestamp=timestamp or datetime.now(),
         )
 
     def is_valid_signal(self, message: str) -> bool:
@@ -1,6 +1,9 @@
 """Trade control module for reading MT4 EA control flags."""
 
 import json
+import os
+import select
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -8,8 +11,66 @@ from typing import Optional
 
 from .logger import logger
 
+# Faster JSON parser when installed, stdlib json otherwise
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
+# Event-driven control file watching (Linux only), per-call reads elsewhere
+try:
+    from inotify_simple import INotify
+    from inotify_simple import flags as inotify_flags
+
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+    INotify = None
+    inotify_flags = None
+
+# Upper bound for one read of the control file; the EA writes well under 1 KB,
+# and anything larger is not a valid control file
+CONTROL_FILE_MAX_BYTES = 65536
+
+
+def _parse_mt4_timestamp(value: str) -> datetime:
+    """Parse an MT4 timestamp ("YYYY.MM.DD HH:MM:SS") by fixed positions.
+
+    Much cheaper than strptime's generic format matching for this layout.
+
+    Args:
+        value: Timestamp string written by the MT4 EA.
+
+    Returns:
+        Parsed datetime.
+
+    Raises:
+        ValueError: If the string is not in the MT4 layout.
+    """
+    if (
+        len(value) != 19
+        or value[4] != "."
+        or value[7] != "."
+        or value[10] != " "
+        or value[13] != ":"
+        or value[16] != ":"
+    ):
+        raise ValueError(f"Not an MT4 timestamp: {value!r}")
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class TradeControlState:
     """Trade control state from MT4 EA."""
 
@@ -32,9 +93,24 @@ class TradeController:
             control_file_path: Path to the trade control JSON file.
         """
         self.control_file_path = Path(control_file_path)
+        # Encoded once for os.stat/os.open, which would otherwise convert the
+        # Path on every check
+        self._path_bytes = os.fsencode(self.control_file_path)
         self._last_state: Optional[TradeControlState] = None
         self._default_enabled = True  # Default to enabled if file not found
 
+        # (st_mtime_ns, st_size, st_ino) of the file behind _cached_state; the
+        # inode catches a same-size file swapped in by rename within one mtime tick
+        self._cache_key: Optional[tuple[int, int, int]] = None
+        self._cached_state: Optional[TradeControlState] = None
+
+        # Background inotify watcher; while it runs, is_trade_enabled() only
+        # reads _watched_enabled instead of touching the file
+        self._watcher: Optional[threading.Thread] = None
+        # Write end of the pipe that wakes the watcher blocked in select()
+        self._wake_w: Optional[int] = None
+        self._watched_enabled = self._default_enabled
+
     def is_trade_enabled(self) -> bool:
         """Check if trade execution is enabled.
 
@@ -42,34 +118,156 @@ class TradeController:
             True if trading is enabled, False otherwise.
             Returns default_enabled value if control file cannot be read.
         """
+        if self._watcher is not None:
+            return self._watched_enabled
+        return self._evaluate()
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether the background watcher is running."""
+        return self._watcher is not None
+
+    def start_watching(self) -> None:
+        """Check the control file on inotify events instead of per call.
+
+        Without inotify (e.g. on Windows) nothing is started and
+        is_trade_enabled() keeps reading the file on each call, so an EA
+        disable still applies to the very next order. The file is read once
+        before returning, so the flag is current as soon as this returns.
+        Does nothing if already watching.
+        """
+        if self._watcher is not None:
+            return
+        if not INOTIFY_AVAILABLE:
+            logger.debug("inotify unavailable, reading trade control file per call")
+            return
+
+        # The directory is watched rather than the file, so a file that is
+        # created later or replaced by rename is still followed. Only
+        # completed writes are reported, never a half-written file
+        try:
+            inotify = INotify()
+        except OSError as e:
+            logger.warning("inotify unavailable for trade control: %s", e)
+            return
+        try:
+            inotify.add_watch(
+                str(self.control_file_path.parent),
+                inotify_flags.CLOSE_WRITE
+                | inotify_flags.MOVED_TO
+                | inotify_flags.MOVED_FROM
+                | inotify_flags.DELETE,
+            )
+        except OSError as e:
+            inotify.close()
+            logger.warning("inotify unavailable for trade control: %s", e)
+            return
+
+        # Read after the watch is in place, so no write can fall in between
+        self._watched_enabled = self._evaluate()
+        wake_r, self._wake_w = os.pipe()
+        self._watcher = threading.Thread(
+            target=self._watch,
+            args=(inotify, wake_r),
+            name="TradeControlWatcher",
+            daemon=True,
+        )
+        self._watcher.start()
+        logger.debug("Watching trade control file (inotify)")
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher and go back to reading on each call."""
+        if self._watcher is None:
+            return
+
+        if self._wake_w is not None:
+            # Closing the write end makes the read end readable (EOF)
+            os.close(self._wake_w)
+            self._wake_w = None
+        self._watcher.join()
+        self._watcher = None
+
+    def _watch(self, inotify: "INotify", wake_r: int) -> None:
+        """Refresh the watched flag on inotify events for the control file.
+
+        Args:
+            inotify: Instance already watching the control file's directory;
+                closed on return.
+            wake_r: Read end of the stop pipe; readable once stopping.
+        """
+        name = self.control_file_path.name
+        try:
+            while True:
+                readable, _, _ = select.select([inotify, wake_r], [], [])
+                if wake_r in readable:
+                    break
+                events = inotify.read(timeout=0)
+                if any(event.name == name for event in events):
+                    self._watched_enabled = self._evaluate()
+        finally:
+            inotify.close()
+            os.close(wake_r)
+
+    def _evaluate(self) -> bool:
+        """Read the control file and resolve the enabled flag.
+
+        Returns:
+            Enabled flag from the file, or the default if it cannot be read.
+        """
         state = self.read_state()
         return state.enabled if state else self._default_enabled
 
     def read_state(self) -> Optional[TradeControlState]:
         """Read the current trade control state from file.
 
+        The file is only parsed again when its modification time, size or
+        inode changes; otherwise the previous result is returned.
+
         Returns:
             TradeControlState if file can be read, None otherwise.
         """
-        if not self.control_file_path.exists():
+        try:
+            st = os.stat(self._path_bytes)
+        except FileNotFoundError:
+            self._cache_key = None
             logger.debug(
-                f"Trade control file not found: {self.control_file_path}. "
-                f"Using default: enabled={self._default_enabled}"
+                "Trade control file not found: %s. Using default: enabled=%s",
+                self.control_file_path,
+                self._default_enabled,
             )
             return None
 
+        cache_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if cache_key == self._cache_key:
+            return self._cached_state
+
+        self._cache_key = cache_key
+        self._cached_state = self._parse_file()
+        return self._cached_state
+
+    def _parse_file(self) -> Optional[TradeControlState]:
+        """Read and parse the control file.
+
+        Returns:
+            TradeControlState if file can be parsed, None otherwise.
+        """
         try:
-            content = self.control_file_path.read_text(encoding="utf-8")
-            data = json.loads(content)
+            # One raw read on a bare descriptor, no buffered file object; both
+            # parsers take the bytes directly, and orjson.JSONDecodeError
+            # subclasses json.JSONDecodeError
+            fd = os.open(self._path_bytes, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            try:
+                content = os.read(fd, CONTROL_FILE_MAX_BYTES)
+            finally:
+                os.close(fd)
+            data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
 
             # Parse updated_at if present
             updated_at = None
             if "updated_at" in data:
                 try:
                     # MT4 format: "YYYY.MM.DD HH:MM:SS"
-                    updated_at = datetime.strptime(
-                        data["updated_at"], "%Y.%m.%d %H:%M:%S"
-                    )
+                    updated_at = _parse_mt4_timestamp(data["updated_at"])
                 except ValueError:
                     # Try alternative formats
                     try:
@@ -86,16 +284,16 @@ class TradeController:
             # Log state change
             if self._last_state is None or self._last_state.enabled != state.enabled:
                 status = "ENABLED" if state.enabled else "DISABLED"
-                logger.info(f"Trade control state: {status}")
+                logger.info("Trade control state: %s", status)
 
             self._last_state = state
             return state
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in trade control file: {e}")
+            logger.warning("Invalid JSON in trade control file: %s", e)
             return None
         except OSError as e:
-            logger.warning(f"Error reading trade control file: {e}")
+            logger.warning("Error reading trade control file: %s", e)
             return None
 
     def set_default_enabled(self, enabled: bool) -> None:
@@ -105,7 +303,11 @@ class TradeController:
             enabled: Default enabled state.
         """
         self._default_enabled = enabled
-        logger.debug(f"Trade control default set to: {enabled}")
+        if self._watcher is not None:
+            # The watcher only re-reads on file events, which may never come
+            # while the file is missing
+            self._watched_enabled = self._evaluate()
+        logger.debug("Trade control default set to: %s", enabled)
 
     @property
     def last_state(self) -> Optional[TradeControlState]:
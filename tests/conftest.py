@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_log(tmp_path: Path) -> Path:
+    """Empty alert log file in a per-test temporary directory.
+
+    Args:
+        tmp_path: Per-test temporary directory provided by pytest.
+
+    Returns:
+        Path to the created log file.
+    """
+    log_path = tmp_path / "alerts.log"
+    log_path.touch()
+    return log_path
@@ -1,12 +1,16 @@
 """Tests for alert_monitor module."""
 
-import tempfile
+import os
+import queue
+import threading
 import time
+from collections import deque
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from watchdog.events import FileModifiedEvent
 
 from src.alert_monitor import (
     AlertFileHandler,
@@ -14,28 +18,23 @@ from src.alert_monitor import (
     get_today_log_filename,
     resolve_log_path,
 )
+from src.signal_parser import SignalParser
 
 
 class TestAlertFileHandler:
     """Test cases for AlertFileHandler."""
 
-    def test_init_with_existing_file(self) -> None:
+    def test_init_with_existing_file(self, temp_log: Path) -> None:
         """Test initialization with existing file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("existing content\n")
-            temp_path = Path(f.name)
+        temp_log.write_text("existing content\n")
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
-
-            # Should start at end of file
-            assert handler._last_position == temp_path.stat().st_size
-            assert handler.file_path == temp_path
-            assert handler.callback == callback
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-        finally:
-            temp_path.unlink()
+        # Should start at end of file
+        assert handler._last_position == temp_log.stat().st_size
+        assert handler.file_path == temp_log
+        assert handler.callback == callback
 
     def test_init_with_nonexistent_file(self) -> None:
         """Test initialization with non-existent file."""
@@ -47,160 +46,294 @@ class TestAlertFileHandler:
         # Should start at position 0
         assert handler._last_position == 0
 
-    def test_read_new_lines(self) -> None:
+    def test_read_new_lines(self, temp_log: Path) -> None:
         """Test reading new lines from file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("initial line\n")
-            temp_path = Path(f.name)
+        temp_log.write_text("initial line\n")
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
-
-            # Write new content
-            with open(temp_path, "a") as f:
-                f.write("BUY XAUUSD SL:1920.50 TP:1950.00\n")
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-            # Read new lines
-            handler._read_new_lines()
+        # Write new content
+        with open(temp_log, "a") as f:
+            f.write("BUY XAUUSD SL:1920.50 TP:1950.00\n")
 
-            # Callback should be called with the new line
-            callback.assert_called_once_with("BUY XAUUSD SL:1920.50 TP:1950.00")
+        # Read new lines
+        handler._read_new_lines()
 
-        finally:
-            temp_path.unlink()
+        # Callback should be called with the new line
+        callback.assert_called_once_with("BUY XAUUSD SL:1920.50 TP:1950.00")
 
-    def test_read_multiple_new_lines(self) -> None:
+    def test_read_multiple_new_lines(self, temp_log: Path) -> None:
         """Test reading multiple new lines from file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
+        # Write multiple lines
+        with open(temp_log, "a") as f:
+            f.write("line 1\n")
+            f.write("line 2\n")
+            f.write("line 3\n")
 
-            # Write multiple lines
-            with open(temp_path, "a") as f:
-                f.write("line 1\n")
-                f.write("line 2\n")
-                f.write("line 3\n")
+        # Read new lines
+        handler._read_new_lines()
 
-            # Read new lines
-            handler._read_new_lines()
+        # Callback should be called for each line
+        assert callback.call_count == 3
+        calls = [call[0][0] for call in callback.call_args_list]
+        assert calls == ["line 1", "line 2", "line 3"]
 
-            # Callback should be called for each line
-            assert callback.call_count == 3
-            calls = [call[0][0] for call in callback.call_args_list]
-            assert calls == ["line 1", "line 2", "line 3"]
+    def test_read_empty_lines_ignored(self, temp_log: Path) -> None:
+        """Test that empty lines are ignored."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-        finally:
-            temp_path.unlink()
+        # Write lines with empty ones
+        with open(temp_log, "a") as f:
+            f.write("line 1\n")
+            f.write("\n")
+            f.write("   \n")
+            f.write("line 2\n")
 
-    def test_read_empty_lines_ignored(self) -> None:
-        """Test that empty lines are ignored."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+        # Read new lines
+        handler._read_new_lines()
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
+        # Only non-empty lines should trigger callback
+        assert callback.call_count == 2
 
-            # Write lines with empty ones
-            with open(temp_path, "a") as f:
-                f.write("line 1\n")
-                f.write("\n")
-                f.write("   \n")
-                f.write("line 2\n")
+    def test_read_lines_trims_whitespace_and_crlf(self, temp_log: Path) -> None:
+        """Test that CRLF endings and surrounding whitespace are removed."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-            # Read new lines
-            handler._read_new_lines()
+        with open(temp_log, "wb") as f:
+            f.write(b"  line 1 \r\n\t\r\n line\t2\r\n")
 
-            # Only non-empty lines should trigger callback
-            assert callback.call_count == 2
+        handler._read_new_lines()
 
-        finally:
-            temp_path.unlink()
+        assert [c.args[0] for c in callback.call_args_list] == [
+            "line 1",
+            "line\t2",
+        ]
 
-    def test_read_lines_with_backslash_continuation(self) -> None:
-        """Test reading lines with backslash continuation."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+    def test_batch_callback_receives_all_lines_once(self, temp_log: Path) -> None:
+        """Test that batch_callback gets every new line in a single call."""
+        batch_callback = MagicMock()
+        handler = AlertFileHandler(temp_log, batch_callback=batch_callback)
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
+        with open(temp_log, "a") as f:
+            f.write("line 1\n\nline 2\nline 3\n")
+        handler._read_new_lines()
+        handler._read_new_lines()
 
-            # Write lines with backslash continuation
-            # Use actual backslash followed by newline
-            with open(temp_path, "a") as f:
-                f.write("This is a long line \\\n")
-                f.write("that continues here\\\n")
-                f.write("and ends here\n")
+        batch_callback.assert_called_once_with(["line 1", "line 2", "line 3"])
 
-            # Read new lines
-            handler._read_new_lines()
+    def test_requires_exactly_one_callback(self, temp_log: Path) -> None:
+        """Test that callback and batch_callback are mutually exclusive."""
+        with pytest.raises(ValueError):
+            AlertFileHandler(temp_log)
+        with pytest.raises(ValueError):
+            AlertFileHandler(temp_log, MagicMock(), batch_callback=MagicMock())
 
-            # Should merge into one line
-            assert callback.call_count == 1
-            expected = "This is a long line that continues hereand ends here"
-            callback.assert_called_once_with(expected)
+    def test_switch_to_drains_old_file_first(self, temp_log: Path) -> None:
+        """Test that switch_to delivers unread old lines, then tails the new file."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
+        new_log = temp_log.with_name("20250116.log")
+        new_log.write_text("new 1\n")
 
-        finally:
-            temp_path.unlink()
+        with open(temp_log, "a") as f:
+            f.write("old 1\n")
+        handler.switch_to(new_log)
+        handler._read_new_lines()
 
-    def test_read_mixed_backslash_and_normal_lines(self) -> None:
-        """Test reading mix of backslash continuation and normal lines."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+        assert [c.args[0] for c in callback.call_args_list] == ["old 1", "new 1"]
+        assert handler.file_path == new_log
+        handler.close()
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
+    def test_read_lines_with_backslash_continuation(self, temp_log: Path) -> None:
+        """Test reading lines with backslash continuation."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-            # Write mixed lines
-            with open(temp_path, "a") as f:
-                f.write("Normal line 1\n")
-                f.write("Continued \\\n")
-                f.write("line 2\n")
-                f.write("Normal line 3\n")
+        # Write lines with backslash continuation
+        # Use actual backslash followed by newline
+        with open(temp_log, "a") as f:
+            f.write("This is a long line \\\n")
+            f.write("that continues here\\\n")
+            f.write("and ends here\n")
 
-            # Read new lines
-            handler._read_new_lines()
+        # Read new lines
+        handler._read_new_lines()
 
-            # Should be 3 lines: normal, merged, normal
-            assert callback.call_count == 3
-            calls = [call[0][0] for call in callback.call_args_list]
-            assert calls == ["Normal line 1", "Continued line 2", "Normal line 3"]
+        # Should merge into one line
+        assert callback.call_count == 1
+        expected = "This is a long line that continues hereand ends here"
+        callback.assert_called_once_with(expected)
 
-        finally:
-            temp_path.unlink()
+    def test_read_mixed_backslash_and_normal_lines(self, temp_log: Path) -> None:
+        """Test reading mix of backslash continuation and normal lines."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
+
+        # Write mixed lines
+        with open(temp_log, "a") as f:
+            f.write("Normal line 1\n")
+            f.write("Continued \\\n")
+            f.write("line 2\n")
+            f.write("Normal line 3\n")
+
+        # Read new lines
+        handler._read_new_lines()
+
+        # Should be 3 lines: normal, merged, normal
+        assert callback.call_count == 3
+        calls = [call[0][0] for call in callback.call_args_list]
+        assert calls == ["Normal line 1", "Continued line 2", "Normal line 3"]
 
-    def test_read_multiple_backslash_continuations(self) -> None:
+    def test_read_multiple_backslash_continuations(self, temp_log: Path) -> None:
         """Test reading multiple consecutive backslash continuations."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback)
+        # Write multiple continuation lines
+        with open(temp_log, "a") as f:
+            f.write("Line 1 \\\n")
+            f.write("continues \\\n")
+            f.write("and continues \\\n")
+            f.write("and finally ends\n")
 
-            # Write multiple continuation lines
-            with open(temp_path, "a") as f:
-                f.write("Line 1 \\\n")
-                f.write("continues \\\n")
-                f.write("and continues \\\n")
-                f.write("and finally ends\n")
+        # Read new lines
+        handler._read_new_lines()
 
-            # Read new lines
-            handler._read_new_lines()
+        # Should merge into one line
+        assert callback.call_count == 1
+        expected = "Line 1 continues and continues and finally ends"
+        callback.assert_called_once_with(expected)
 
-            # Should merge into one line
-            assert callback.call_count == 1
-            expected = "Line 1 continues and continues and finally ends"
-            callback.assert_called_once_with(expected)
+    def test_partial_line_buffered_until_newline(self, temp_log: Path) -> None:
+        """Test that an incomplete line is held until its newline arrives."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-        finally:
-            temp_path.unlink()
+        with open(temp_log, "a") as f:
+            f.write("BUY XAUUSD SL:1920.50")
+        handler._read_new_lines()
+        callback.assert_not_called()
+
+        with open(temp_log, "a") as f:
+            f.write(" TP:1950.00\n")
+        handler._read_new_lines()
+        callback.assert_called_once_with("BUY XAUUSD SL:1920.50 TP:1950.00")
+
+        handler.close()
+
+    def test_continuation_across_reads(self, temp_log: Path) -> None:
+        """Test backslash continuation completed by a later write."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
+
+        with open(temp_log, "a") as f:
+            f.write("First part \\\n")
+        handler._read_new_lines()
+        callback.assert_not_called()
+
+        with open(temp_log, "a") as f:
+            f.write("second part\n")
+        handler._read_new_lines()
+        callback.assert_called_once_with("First part second part")
+
+        handler.close()
+
+    def test_read_after_truncation(self, temp_log: Path) -> None:
+        """Test that a truncated file is reread from the beginning."""
+        temp_log.write_text("old content that is fairly long\n")
+
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
+        handler._read_new_lines()
+
+        with open(temp_log, "w") as f:
+            f.write("new line\n")
+        handler._read_new_lines()
+
+        callback.assert_called_once_with("new line")
+        handler.close()
+
+    def test_debounce_coalesces_modify_events(self, temp_log: Path) -> None:
+        """Test that a burst of modify events results in a single read."""
+        received = threading.Event()
+        callback = MagicMock(side_effect=lambda line: received.set())
+        handler = AlertFileHandler(temp_log, callback, debounce_seconds=0.05)
+
+        with patch.object(
+            handler, "_read_new_lines", wraps=handler._read_new_lines
+        ) as read_mock:
+            with open(temp_log, "a") as f:
+                f.write("line1\n")
+            for _ in range(5):
+                handler.handle_modified(str(temp_log))
+
+            # Nothing is read until the debounce window elapses
+            callback.assert_not_called()
+            assert received.wait(timeout=2.0)
+            assert read_mock.call_count == 1
+
+        callback.assert_called_once_with("line1")
+        handler.close()
+
+    def test_debounce_reuses_one_thread(self, temp_log: Path) -> None:
+        """Test that successive bursts are read by the same debounce thread."""
+        received: queue.Queue[str] = queue.Queue()
+        handler = AlertFileHandler(temp_log, received.put, debounce_seconds=0.01)
+
+        threads = []
+        for line in ("line1", "line2"):
+            with open(temp_log, "a") as f:
+                f.write(f"{line}\n")
+            handler.handle_modified(str(temp_log))
+            assert received.get(timeout=2.0) == line
+            threads.append(handler._debounce_thread)
+
+        assert threads[0] is not None
+        assert threads[0] is threads[1]
+        handler.close()
+        assert not threads[0].is_alive()
+
+    def test_close_while_flush_pending(self, temp_log: Path) -> None:
+        """Test that close() waits for an in-flight read and blocks later ones."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback, debounce_seconds=0.01)
+        with open(temp_log, "a") as f:
+            f.write("line1\n")
+
+        # Hold the debounced read inside _read_new_lines until close() is waiting
+        entered = threading.Event()
+        release = threading.Event()
+        read_new_lines = handler._read_new_lines
+
+        def blocked_read() -> None:
+            entered.set()
+            release.wait(timeout=2.0)
+            read_new_lines()
+
+        with patch.object(handler, "_read_new_lines", side_effect=blocked_read):
+            handler.handle_modified(str(temp_log))
+            assert entered.wait(timeout=2.0)
+            threading.Timer(0.05, release.set).start()
+            handler.close()
+
+        # The read already running finished before close() returned
+        callback.assert_called_once_with("line1")
+        assert handler._fd is None
+
+        # A flush that fires after close(), and any late event, reads nothing
+        with open(temp_log, "a") as f:
+            f.write("line2\n")
+        handler._read_pending = True
+        handler._flush_pending_read()
+        handler.handle_modified(str(temp_log))
+        assert handler._fd is None
+        callback.assert_called_once_with("line1")
 
 
 class TestAlertMonitor:
@@ -223,71 +356,159 @@ class TestAlertMonitor:
 
         assert monitor.is_running() is False
 
-    def test_start_and_stop(self) -> None:
+    def test_start_and_stop(self, temp_log: Path) -> None:
         """Test starting and stopping monitor."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_path = Path(temp_dir) / "alerts.log"
-            log_path.touch()
-
-            callback = MagicMock()
-            monitor = AlertMonitor(log_path, callback)
+        callback = MagicMock()
+        monitor = AlertMonitor(temp_log, callback)
 
-            # Start
-            monitor.start()
-            assert monitor.is_running() is True
-            assert monitor._observer is not None
-            assert monitor._handler is not None
+        # Start
+        monitor.start()
+        assert monitor.is_running() is True
+        assert monitor._observer is not None
+        assert monitor._handler is not None
 
-            # Stop
-            monitor.stop()
-            assert monitor._observer is None
+        # Stop
+        monitor.stop()
+        assert monitor._observer is None
 
-    def test_start_with_nonexistent_file(self) -> None:
+    def test_start_with_nonexistent_file(self, tmp_path: Path) -> None:
         """Test starting with non-existent file (should not raise)."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_path = Path(temp_dir) / "nonexistent.log"
+        log_path = tmp_path / "nonexistent.log"
+
+        callback = MagicMock()
+        monitor = AlertMonitor(log_path, callback)
 
-            callback = MagicMock()
-            monitor = AlertMonitor(log_path, callback)
+        # Should not raise even if file doesn't exist
+        monitor.start()
+        assert monitor.is_running() is True
 
-            # Should not raise even if file doesn't exist
-            monitor.start()
-            assert monitor.is_running() is True
+        monitor.stop()
 
-            monitor.stop()
+    def test_queue_full_drops_oldest_line(self) -> None:
+        """Test that a full line queue drops the oldest line."""
+        monitor = AlertMonitor("/path/to/alerts.log", MagicMock())
+        monitor._lines = deque(maxlen=2)
 
-    def test_file_monitoring_integration(self) -> None:
-        """Integration test for file monitoring."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_path = Path(temp_dir) / "alerts.log"
-            log_path.touch()
+        monitor._enqueue_lines(["line1", "line2"])
+        monitor._enqueue_lines(["line3"])
+
+        assert list(monitor._lines) == ["line2", "line3"]
 
-            received_lines: list[str] = []
+    def test_symbol_filter_drops_other_entry_alerts(self) -> None:
+        """Test that entry alerts for unlisted symbols are not queued."""
+        monitor = AlertMonitor(
+            "/path/to/alerts.log", MagicMock(), symbol_filter=frozenset({"XAUUSD"})
+        )
 
-            def callback(line: str) -> None:
-                received_lines.append(line)
+        monitor._enqueue_lines(
+            [
+                "Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00",
+                "Ark_BTC sell ETHUSD SL:3000.00 TP:2900.00",
+                "ロング決済サイン at price: 2650.50",
+            ]
+        )
 
-            monitor = AlertMonitor(log_path, callback)
-            monitor.start()
+        assert list(monitor._lines) == [
+            "Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00",
+            "ロング決済サイン at price: 2650.50",
+        ]
 
-            try:
-                # Give observer time to start
-                time.sleep(0.1)
+    def test_symbol_filter_matches_parser_action(self) -> None:
+        """Test that the filter uses the BUY/SELL the parser does, not the first."""
+        message = "Ark_BTC Sell zone BUY XAUUSD SL:1920.5 TP:1950"
+        assert SignalParser(valid_symbols=["XAUUSD"]).parse(message) is not None
+        monitor = AlertMonitor(
+            "/path/to/alerts.log", MagicMock(), symbol_filter=frozenset({"XAUUSD"})
+        )
 
-                # Write to file
-                with open(log_path, "a") as f:
-                    f.write("BUY XAUUSD SL:1920.50 TP:1950.00\n")
-                    f.flush()
+        monitor._enqueue_lines([message])
 
-                # Wait for file system event
-                time.sleep(0.5)
+        assert list(monitor._lines) == [message]
 
-                # Check if line was received
-                # Note: This might be flaky depending on file system
-                # In real tests, you might want to use a more robust approach
+    def test_symbol_filter_keeps_lines_without_ark_prefix(self) -> None:
+        """Test that only Ark_ entry alerts are filtered, like the parser."""
+        monitor = AlertMonitor(
+            "/path/to/alerts.log", MagicMock(), symbol_filter=frozenset({"XAUUSD"})
+        )
 
-            finally:
-                monitor.stop()
+        monitor._enqueue_lines(["Note: BUY ETHUSD SL:3000.00 TP:3100.00"])
+
+        assert list(monitor._lines) == ["Note: BUY ETHUSD SL:3000.00 TP:3100.00"]
+
+    def test_stop_delivers_queued_lines(self, temp_log: Path) -> None:
+        """Test that lines queued before stop() still reach the callback."""
+        callback = MagicMock()
+        monitor = AlertMonitor(temp_log, callback)
+        monitor.start()
+
+        monitor._enqueue_lines(["line1", "line2"])
+        monitor.stop()
+
+        assert [c.args[0] for c in callback.call_args_list] == ["line1", "line2"]
+        assert monitor._worker is None
+
+    def test_stop_keeps_full_queue(self, temp_log: Path) -> None:
+        """Test that stop() does not evict a line from a full queue."""
+        callback = MagicMock()
+        monitor = AlertMonitor(temp_log, callback)
+        monitor._lines = deque(maxlen=2)
+        monitor.start()
+        # Hold the worker so both lines are still queued when stop() runs
+        monitor._lines_ready.clear()
+        with patch.object(monitor._lines_ready, "set"):
+            monitor._enqueue_lines(["line1", "line2"])
+        monitor.stop()
+
+        assert [c.args[0] for c in callback.call_args_list] == ["line1", "line2"]
+
+    def test_invalid_backend(self) -> None:
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            AlertMonitor("/path/to/alerts.log", MagicMock(), backend="poll")
+
+    @pytest.mark.parametrize("backend", ["inotify", "watchdog"])
+    def test_backend_delivers_lines(self, temp_log: Path, backend: str) -> None:
+        """Test that each backend delivers appended lines to the callback."""
+        if backend == "inotify":
+            pytest.importorskip("inotify_simple")
+
+        received: queue.Queue[str] = queue.Queue()
+        monitor = AlertMonitor(temp_log, received.put, backend=backend)
+        monitor.start()
+
+        try:
+            with open(temp_log, "a") as f:
+                f.write("Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00\n")
+
+            line = received.get(timeout=2.0)
+            assert line == "Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00"
+        finally:
+            monitor.stop()
+
+    def test_file_monitoring_integration(self, temp_log: Path) -> None:
+        """Integration test for file monitoring."""
+        received_lines: list[str] = []
+        received = threading.Event()
+
+        def callback(line: str) -> None:
+            received_lines.append(line)
+            received.set()
+
+        monitor = AlertMonitor(temp_log, callback)
+        monitor.start()
+
+        try:
+            # Write to file
+            with open(temp_log, "a") as f:
+                f.write("BUY XAUUSD SL:1920.50 TP:1950.00\n")
+                f.flush()
+
+            # Wait for the line instead of a fixed sleep
+            assert received.wait(timeout=2.0), "no line received"
+            assert received_lines == ["BUY XAUUSD SL:1920.50 TP:1950.00"]
+
+        finally:
+            monitor.stop()
 
 
 class TestResolvePath:
@@ -307,29 +528,27 @@ class TestResolvePath:
 
         assert str(result) == f"/logs/{today_str}.log"
 
-    def test_resolve_directory_with_log_files(self) -> None:
+    def test_resolve_directory_with_log_files(self, tmp_path: Path) -> None:
         """Test resolving directory path with existing log files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create some log files
-            old_log = Path(temp_dir) / "20250101.log"
-            new_log = Path(temp_dir) / "20250115.log"
-            old_log.touch()
-            time.sleep(0.1)  # Ensure different mtime
-            new_log.touch()
+        # Create some log files
+        old_log = tmp_path / "20250101.log"
+        new_log = tmp_path / "20250115.log"
+        old_log.touch()
+        new_log.touch()
+        os.utime(old_log, (0, 0))  # Ensure different mtime
 
-            result = resolve_log_path(temp_dir)
+        result = resolve_log_path(tmp_path)
 
-            # Should return the latest log file
-            assert result == new_log
+        # Should return the latest log file
+        assert result == new_log
 
-    def test_resolve_directory_without_log_files(self) -> None:
+    def test_resolve_directory_without_log_files(self, tmp_path: Path) -> None:
         """Test resolving directory path without log files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            today_str = date.today().strftime("%Y%m%d")
-            result = resolve_log_path(temp_dir)
+        today_str = date.today().strftime("%Y%m%d")
+        result = resolve_log_path(tmp_path)
 
-            # Should return expected today's log file
-            assert result == Path(temp_dir) / f"{today_str}.log"
+        # Should return expected today's log file
+        assert result == tmp_path / f"{today_str}.log"
 
     def test_resolve_regular_path(self) -> None:
         """Test resolving regular path without placeholders."""
@@ -352,43 +571,50 @@ class TestGetTodayLogFilename:
 class TestAlertFileHandlerDateSwitch:
     """Test cases for AlertFileHandler date switching."""
 
-    def test_auto_switch_date_disabled(self) -> None:
+    def test_auto_switch_date_disabled(self, temp_log: Path) -> None:
         """Test that date switch is disabled when auto_switch_date=False."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_path = Path(f.name)
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback, auto_switch_date=False)
 
-        try:
-            callback = MagicMock()
-            handler = AlertFileHandler(temp_path, callback, auto_switch_date=False)
+        # Manually change internal date to yesterday
+        handler._current_date = date(2020, 1, 1)
 
-            # Manually change internal date to yesterday
-            handler._current_date = date(2020, 1, 1)
+        # Should not switch
+        assert handler._check_date_change() is False
+        assert handler.file_path == temp_log
 
-            # Should not switch
-            assert handler._check_date_change() is False
-            assert handler.file_path == temp_path
+    def test_auto_switch_date_enabled(self, tmp_path: Path) -> None:
+        """Test that date switch works when enabled."""
+        old_log = tmp_path / "20200101.log"
+        old_log.touch()
 
-        finally:
-            temp_path.unlink()
+        callback = MagicMock()
+        handler = AlertFileHandler(old_log, callback, auto_switch_date=True)
 
-    def test_auto_switch_date_enabled(self) -> None:
-        """Test that date switch works when enabled."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            old_log = Path(temp_dir) / "20200101.log"
-            old_log.touch()
+        # Manually change internal date to yesterday
+        handler._current_date = date(2020, 1, 1)
 
-            callback = MagicMock()
-            handler = AlertFileHandler(old_log, callback, auto_switch_date=True)
+        # Should switch to today's log
+        result = handler._check_date_change()
 
-            # Manually change internal date to yesterday
-            handler._current_date = date(2020, 1, 1)
+        assert result is True
+        assert handler.file_path.name == get_today_log_filename()
+        assert handler._current_date == date.today()
 
-            # Should switch to today's log
-            result = handler._check_date_change()
+    def test_date_check_skipped_before_midnight(self, temp_log: Path) -> None:
+        """Test that modify events only check the date once midnight has passed."""
+        callback = MagicMock()
+        handler = AlertFileHandler(temp_log, callback)
 
-            assert result is True
-            assert handler.file_path.name == get_today_log_filename()
-            assert handler._current_date == date.today()
+        with patch.object(handler, "_check_date_change") as check_mock:
+            handler.handle_modified(str(temp_log))
+            check_mock.assert_not_called()
+
+            # Pretend midnight has already passed
+            handler._next_midnight_epoch = 0.0
+            handler.handle_modified(str(temp_log))
+            check_mock.assert_called_once()
+            assert handler._next_midnight_epoch > time.time()
 
 
 class TestAlertMonitorAutoResolve:
@@ -411,17 +637,92 @@ class TestAlertMonitorAutoResolve:
 
         assert str(monitor.alert_log_path) == "/logs/{date}.log"
 
-    def test_get_current_log_path(self) -> None:
+    def test_get_current_log_path(self, tmp_path: Path) -> None:
         """Test get_current_log_path method."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_path = Path(temp_dir) / "debug.log"
-            log_path.touch()
-
-            callback = MagicMock()
-            monitor = AlertMonitor(log_path, callback)
-            monitor.start()
-
-            try:
-                assert monitor.get_current_log_path() == log_path
-            finally:
-                monitor.stop()
+        log_path = tmp_path / "debug.log"
+        log_path.touch()
+
+        callback = MagicMock()
+        monitor = AlertMonitor(log_path, callback)
+        monitor.start()
+
+        try:
+            assert monitor.get_current_log_path() == log_path
+        finally:
+            monitor.stop()
+
+
+class TestInotifyObserver:
+    """Test cases for the inotify-driven observer backend."""
+
+    def test_inotify_backend_delivers_lines(self, temp_log: Path) -> None:
+        """Test that the inotify backend is used and delivers new lines."""
+        pytest.importorskip("inotify_simple")
+
+        received = threading.Event()
+        received_lines: list[str] = []
+
+        def callback(line: str) -> None:
+            received_lines.append(line)
+            received.set()
+
+        monitor = AlertMonitor(temp_log, callback)
+        monitor.start()
+
+        try:
+            assert type(monitor._observer).__name__ == "_InotifyObserver"
+
+            with open(temp_log, "a") as f:
+                f.write("BUY XAUUSD SL:1920.50 TP:1950.00\n")
+
+            assert received.wait(timeout=2.0)
+            assert received_lines == ["BUY XAUUSD SL:1920.50 TP:1950.00"]
+        finally:
+            monitor.stop()
+
+        assert monitor.is_running() is False
+
+    def test_inotify_backend_follows_new_log_file(self, tmp_path: Path) -> None:
+        """Test that the file watch moves to a newly created log file."""
+        pytest.importorskip("inotify_simple")
+
+        old_log = tmp_path / "20200101.log"
+        old_log.touch()
+        os.utime(old_log, (0, 0))
+        new_log = tmp_path / "20200102.log"
+
+        received = threading.Event()
+        received_lines: list[str] = []
+
+        def callback(line: str) -> None:
+            received_lines.append(line)
+            received.set()
+
+        monitor = AlertMonitor(old_log, callback, auto_resolve_date=False)
+        monitor.start()
+
+        try:
+            with open(new_log, "a") as f:
+                f.write("SELL XAUUSD SL:1950.00 TP:1920.00\n")
+
+            assert received.wait(timeout=2.0)
+            assert monitor.get_current_log_path() == new_log
+            assert received_lines == ["SELL XAUUSD SL:1950.00 TP:1920.00"]
+        finally:
+            monitor.stop()
+
+
+class TestAlertFileHandlerEventFilter:
+    """Test cases for filtering watchdog events by file name."""
+
+    def test_modified_event_for_other_file_ignored(self) -> None:
+        """Test that modify events for other files never reach the handler."""
+        callback = MagicMock()
+        handler = AlertFileHandler(Path("/tmp/alerts/target.log"), callback)
+
+        with patch.object(handler, "handle_modified") as handle_mock:
+            handler.on_modified(FileModifiedEvent("/tmp/alerts/other.log"))
+            handle_mock.assert_not_called()
+
+            handler.on_modified(FileModifiedEvent("/tmp/alerts/target.log"))
+            handle_mock.assert_called_once_with("/tmp/alerts/target.log")
@@ -1,6 +1,6 @@
 """Tests for config module."""
 
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -16,6 +16,19 @@ from src.config import (
 )
 
 
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Path for a YAML config file in a per-test temporary directory.
+
+    Args:
+        tmp_path: Per-test temporary directory provided by pytest.
+
+    Returns:
+        Path to the (not yet created) config file.
+    """
+    return tmp_path / "settings.yaml"
+
+
 class TestSymbolConfig:
     """Test cases for SymbolConfig."""
 
@@ -33,6 +46,12 @@ class TestSymbolConfig:
         assert config.lot_size == 0.1
         assert config.weekend_stop is True
 
+    def test_is_immutable(self) -> None:
+        """Test that SymbolConfig cannot be modified after creation."""
+        config = SymbolConfig()
+        with pytest.raises(AttributeError):
+            config.lot_size = 0.1  # type: ignore[misc]
+
 
 class TestMT4Config:
     """Test cases for MT4Config."""
@@ -57,6 +76,7 @@ class TestMT5Config:
         assert config.login == 0
         assert config.password == ""
         assert config.server == ""
+        assert config.terminal_path == ""
 
     def test_custom_values(self) -> None:
         """Test custom values."""
@@ -99,7 +119,7 @@ class TestConfig:
         assert isinstance(config.logging, LoggingConfig)
         assert config.symbols == {}
 
-    def test_from_yaml(self) -> None:
+    def test_from_yaml(self, config_file: Path) -> None:
         """Test loading from YAML file."""
         yaml_content = """
 mt4:
@@ -129,55 +149,44 @@ logging:
   file_path: "logs/debug.log"
   rotation: daily
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        config_file.write_text(yaml_content)
 
-        try:
-            config = Config.from_yaml(temp_path)
+        config = Config.from_yaml(config_file)
 
-            # MT4
-            assert config.mt4.alert_log_path == "/path/to/logs"
+        # MT4
+        assert config.mt4.alert_log_path == "/path/to/logs"
 
-            # MT5
-            assert config.mt5.login == 12345678
-            assert config.mt5.password == "test_password"
-            assert config.mt5.server == "TestServer-Live"
+        # MT5
+        assert config.mt5.login == 12345678
+        assert config.mt5.password == "test_password"
+        assert config.mt5.server == "TestServer-Live"
 
-            # Symbols
-            assert "XAUUSD" in config.symbols
-            assert "BTCUSD" in config.symbols
-            assert config.symbols["XAUUSD"].lot_size == 0.02
-            assert config.symbols["XAUUSD"].weekend_stop is True
-            assert config.symbols["BTCUSD"].weekend_stop is False
+        # Symbols
+        assert "XAUUSD" in config.symbols
+        assert "BTCUSD" in config.symbols
+        assert config.symbols["XAUUSD"].lot_size == 0.02
+        assert config.symbols["XAUUSD"].weekend_stop is True
+        assert config.symbols["BTCUSD"].weekend_stop is False
 
-            # Trading
-            assert config.trading.duplicate_threshold_seconds == 300
-            assert config.trading.max_execution_delay_seconds == 2
+        # Trading
+        assert config.trading.duplicate_threshold_seconds == 300
+        assert config.trading.max_execution_delay_seconds == 2
 
-            # Logging
-            assert config.logging.level == "DEBUG"
-            assert config.logging.file_path == "logs/debug.log"
-
-        finally:
-            Path(temp_path).unlink()
+        # Logging
+        assert config.logging.level == "DEBUG"
+        assert config.logging.file_path == "logs/debug.log"
 
     def test_from_yaml_file_not_found(self) -> None:
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
             Config.from_yaml("/non/existent/path.yaml")
 
-    def test_from_yaml_empty_file(self) -> None:
+    def test_from_yaml_empty_file(self, config_file: Path) -> None:
         """Test loading from empty file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("")
-            temp_path = f.name
+        config_file.write_text("")
 
-        try:
-            with pytest.raises(ValueError, match="empty"):
-                Config.from_yaml(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(ValueError, match="empty"):
+            Config.from_yaml(config_file)
 
     def test_get_enabled_symbols(self) -> None:
         """Test get_enabled_symbols method."""
@@ -208,7 +217,7 @@ logging:
         # Non-existing symbol
         assert config.get_symbol_config("UNKNOWN") is None
 
-    def test_partial_yaml(self) -> None:
+    def test_partial_yaml(self, config_file: Path) -> None:
         """Test loading partial YAML (only some sections)."""
         yaml_content = """
 mt5:
@@ -216,19 +225,60 @@ mt5:
   password: "partial"
   server: "PartialServer"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        config_file.write_text(yaml_content)
+
+        config = Config.from_yaml(config_file)
+
+        # MT5 should be loaded
+        assert config.mt5.login == 99999
+
+        # Others should have defaults
+        assert config.mt4.alert_log_path == ""
+        assert config.trading.duplicate_threshold_seconds == 180
+
+    def test_from_yaml_reloads_after_change(self, config_file: Path) -> None:
+        """Test that a modified config file is parsed again, not served from cache."""
+        config_file.write_text("mt5:\n  login: 111\n")
 
-        try:
-            config = Config.from_yaml(temp_path)
+        first = Config.from_yaml(config_file)
+        second = Config.from_yaml(config_file)
+        assert first.mt5.login == second.mt5.login == 111
+        assert first is not second
 
-            # MT5 should be loaded
-            assert config.mt5.login == 99999
+        config_file.write_text("mt5:\n  login: 222\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert Config.from_yaml(config_file).mt5.login == 222
+
+    def test_from_yaml_reloads_within_one_mtime_tick(self, config_file: Path) -> None:
+        """Test that a rewrite keeping the mtime is caught by size or inode."""
+        config_file.write_text("mt5:\n  login: 111\n")
+        stat = config_file.stat()
+        assert Config.from_yaml(config_file).mt5.login == 111
+
+        # Same mtime, different size
+        config_file.write_text("mt5:\n  login: 2222\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert Config.from_yaml(config_file).mt5.login == 2222
+
+        # Same mtime and size, new inode
+        replacement = config_file.with_name("replacement.yaml")
+        replacement.write_text("mt5:\n  login: 3333\n")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, config_file)
+        assert Config.from_yaml(config_file).mt5.login == 3333
+
+    def test_enabled_symbol_set(self) -> None:
+        """Test enabled_symbol_set is cached and refreshed when symbols change."""
+        config = Config()
+        config.symbols = {
+            "XAUUSD": SymbolConfig(enabled=True),
+            "BTCUSD": SymbolConfig(enabled=False),
+        }
 
-            # Others should have defaults
-            assert config.mt4.alert_log_path == ""
-            assert config.trading.duplicate_threshold_seconds == 180
+        assert config.enabled_symbol_set == frozenset({"XAUUSD"})
+        assert config.enabled_symbol_set is config.enabled_symbol_set
 
-        finally:
-            Path(temp_path).unlink()
+        config.symbols = {"ETHUSD": SymbolConfig(enabled=True)}
+        assert config.enabled_symbol_set == frozenset({"ETHUSD"})
@@ -1,16 +1,27 @@
 """Tests for order_executor module."""
 
-import json
-import tempfile
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.config import Config, SymbolConfig, TradeControlConfig
-from src.order_executor import DuplicateChecker, OrderExecutor, TradingTimeChecker
+from src.config import (
+    Config,
+    MT5Config,
+    SymbolConfig,
+    TradeControlConfig,
+    TradingConfig,
+)
+from src.order_executor import (
+    DuplicateChecker,
+    OrderExecutor,
+    OrderResult,
+    TradingTimeChecker,
+)
 from src.signal_parser import Signal, SignalAction
+from src.trade_control import TradeController
 
 
 class TestDuplicateChecker:
@@ -105,12 +116,41 @@ class TestDuplicateChecker:
         assert checker.is_duplicate(signal) is False
 
         # Manually set last signal time to past using the correct key format
-        key = f"XAUUSD_{SignalAction.BUY.value}"
-        checker._last_signals[key] = datetime.now() - timedelta(seconds=2)
+        key = ("XAUUSD", SignalAction.BUY)
+        checker._last_signals[key] = time.monotonic_ns() - 2_000_000_000
 
         # Should not be duplicate now
         assert checker.is_duplicate(signal) is False
 
+    def test_oldest_key_evicted_beyond_max_entries(self) -> None:
+        """Test that the least recently seen key is evicted when full."""
+        checker = DuplicateChecker(threshold_seconds=180, max_entries=2)
+
+        for symbol in ("XAUUSD", "BTCUSD", "ETHUSD"):
+            signal = Signal(
+                action=SignalAction.BUY,
+                symbol=symbol,
+                stop_loss=100.0,
+                take_profit=110.0,
+                timestamp=datetime.now(),
+            )
+            assert checker.is_duplicate(signal) is False
+
+        assert list(checker._last_signals) == [
+            ("BTCUSD", SignalAction.BUY),
+            ("ETHUSD", SignalAction.BUY),
+        ]
+
+    def test_sweep_removes_expired_entries(self) -> None:
+        """Test that sweep drops only entries outside the threshold window."""
+        checker = DuplicateChecker(threshold_seconds=1)
+        now = time.monotonic_ns()
+        checker._last_signals[("XAUUSD", SignalAction.BUY)] = now - 5_000_000_000
+        checker._last_signals[("BTCUSD", SignalAction.BUY)] = now
+
+        assert checker.sweep(now) == 1
+        assert list(checker._last_signals) == [("BTCUSD", SignalAction.BUY)]
+
     def test_clear(self) -> None:
         """Test clear method."""
         checker = DuplicateChecker(threshold_seconds=180)
@@ -177,6 +217,16 @@ class TestTradingTimeChecker:
         # Should allow trading even on weekend
         assert checker.can_trade("BTCUSD", config) is True
 
+    def test_is_weekend_matches_datetime_weekday(self) -> None:
+        """Test is_weekend agrees with datetime's weekday for the same day."""
+        # 2024-01-06 is a Saturday, 2024-01-08 a Monday
+        for day, expected in ((6, True), (7, True), (8, False)):
+            stamp = time.mktime((2024, 1, day, 12, 0, 0, 0, 0, -1))
+            local = time.localtime(stamp)
+            with patch("src.order_executor.time.localtime", return_value=local):
+                assert TradingTimeChecker.is_weekend() is expected
+            assert (datetime.fromtimestamp(stamp).weekday() >= 5) is expected
+
 
 class TestOrderExecutor:
     """Test cases for OrderExecutor."""
@@ -184,14 +234,12 @@ class TestOrderExecutor:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.config = Config()
-        self.config.mt5.login = 12345
-        self.config.mt5.password = "test"
-        self.config.mt5.server = "TestServer"
+        self.config.mt5 = MT5Config(login=12345, password="test", server="TestServer")
         self.config.symbols = {
             "XAUUSD": SymbolConfig(enabled=True, lot_size=0.01, weekend_stop=True),
             "BTCUSD": SymbolConfig(enabled=True, lot_size=0.02, weekend_stop=False),
         }
-        self.config.trading.duplicate_threshold_seconds = 180
+        self.config.trading = TradingConfig(duplicate_threshold_seconds=180)
 
     def test_init(self) -> None:
         """Test OrderExecutor initialization."""
@@ -207,7 +255,8 @@ class TestOrderExecutor:
         executor = OrderExecutor(self.config)
         assert executor.is_connected() is False
 
-    def test_execute_duplicate_signal(self) -> None:
+    @patch.object(TradingTimeChecker, "is_weekend", return_value=False)
+    def test_execute_duplicate_signal(self, mock_is_weekend: MagicMock) -> None:
         """Test execute with duplicate signal."""
         executor = OrderExecutor(self.config)
         executor._connected = True
@@ -281,70 +330,60 @@ class TestOrderExecutor:
         assert result.success is False
         assert "not allowed" in (result.error_message or "")
 
-    def test_trade_control_disabled_by_ea(self) -> None:
+    def test_trade_control_created_from_config(self) -> None:
+        """Test that an enabled trade_control config creates a controller."""
+        self.config.trade_control = TradeControlConfig(
+            enabled=True,
+            control_file_path="/path/to/trade_control.json",
+            default_enabled=False,
+        )
+        executor = OrderExecutor(self.config)
+
+        assert executor.trade_controller is not None
+        assert executor.trade_controller.control_file_path == Path(
+            "/path/to/trade_control.json"
+        )
+
+    @patch.object(TradingTimeChecker, "is_weekend", return_value=False)
+    def test_trade_control_disabled_by_ea(self, mock_is_weekend: MagicMock) -> None:
         """Test execute when trade is disabled by MT4 EA."""
-        # Create control file with enabled=false
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": False}, f)
-            temp_path = f.name
-
-        try:
-            self.config.trade_control = TradeControlConfig(
-                enabled=True,
-                control_file_path=temp_path,
-                default_enabled=True,
-            )
-            executor = OrderExecutor(self.config)
-            executor._connected = True
+        controller = MagicMock(spec=TradeController)
+        controller.is_trade_enabled.return_value = False
+        executor = OrderExecutor(self.config, trade_controller=controller)
+        executor._connected = True
 
-            signal = Signal(
-                action=SignalAction.BUY,
-                symbol="XAUUSD",
-                stop_loss=1920.0,
-                take_profit=1950.0,
-                timestamp=datetime.now(),
-            )
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.0,
+            take_profit=1950.0,
+            timestamp=datetime.now(),
+        )
 
-            result = executor.execute(signal)
-            assert result.success is False
-            assert "disabled by MT4" in (result.error_message or "")
-        finally:
-            Path(temp_path).unlink()
+        result = executor.execute(signal)
+        assert result.success is False
+        assert "disabled by MT4" in (result.error_message or "")
 
-    def test_trade_control_enabled_by_ea(self) -> None:
+    @patch.object(TradingTimeChecker, "is_weekend", return_value=False)
+    def test_trade_control_enabled_by_ea(self, mock_is_weekend: MagicMock) -> None:
         """Test execute when trade is enabled by MT4 EA."""
-        # Create control file with enabled=true
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": True}, f)
-            temp_path = f.name
-
-        try:
-            self.config.trade_control = TradeControlConfig(
-                enabled=True,
-                control_file_path=temp_path,
-                default_enabled=True,
-            )
-            executor = OrderExecutor(self.config)
-            executor._connected = True
-
-            signal = Signal(
-                action=SignalAction.BUY,
-                symbol="XAUUSD",
-                stop_loss=1920.0,
-                take_profit=1950.0,
-                timestamp=datetime.now(),
-            )
+        controller = MagicMock(spec=TradeController)
+        controller.is_trade_enabled.return_value = True
+        executor = OrderExecutor(self.config, trade_controller=controller)
+        executor._connected = True
 
-            # Should pass trade control check but fail at duplicate check
-            # (since we already marked this as seen in __init__)
-            # Let's use a fresh signal
-            executor.duplicate_checker.clear()
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.0,
+            take_profit=1950.0,
+            timestamp=datetime.now(),
+        )
 
-            result = executor.execute(signal)
-            # Will fail at MT5 connection, but should not fail at trade control
-            assert "disabled by MT4" not in (result.error_message or "")
-        finally:
-            Path(temp_path).unlink()
+        result = executor.execute(signal)
+        # Will fail at MT5 connection, but should not fail at trade control
+        assert "disabled by MT4" not in (result.error_message or "")
+        controller.is_trade_enabled.assert_called_once_with()
 
     def test_trade_control_not_configured(self) -> None:
         """Test execute when trade control is not configured."""
@@ -364,3 +403,125 @@ class TestOrderExecutor:
         result = executor.execute(signal)
         # Will fail at duplicate or other check, not trade control
         assert "disabled by MT4" not in (result.error_message or "")
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_connect_uses_terminal_path(self, mock_mt5: MagicMock) -> None:
+        """Test that a configured terminal path is passed to initialize."""
+        self.config.mt5 = MT5Config(terminal_path="C:/MT5-2/terminal64.exe")
+        executor = OrderExecutor(self.config)
+
+        assert executor.connect() is True
+        mock_mt5.initialize.assert_called_once_with(path="C:/MT5-2/terminal64.exe")
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_connect_starts_trade_control_watcher(self, mock_mt5: MagicMock) -> None:
+        """Test that connect/disconnect start and stop the control file watcher."""
+        controller = MagicMock(spec=TradeController)
+        controller.is_watching = False
+        executor = OrderExecutor(self.config, trade_controller=controller)
+
+        assert executor.connect() is True
+        controller.start_watching.assert_called_once_with()
+
+        executor.disconnect()
+        controller.stop_watching.assert_called_once_with()
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_disconnect_keeps_shared_watcher(self, mock_mt5: MagicMock) -> None:
+        """Test that a watcher started elsewhere survives this executor."""
+        controller = MagicMock(spec=TradeController)
+        controller.is_watching = True
+        executor = OrderExecutor(self.config, trade_controller=controller)
+
+        assert executor.connect() is True
+        executor.disconnect()
+
+        controller.start_watching.assert_not_called()
+        controller.stop_watching.assert_not_called()
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_send_order_caches_symbol_info(self, mock_mt5: MagicMock) -> None:
+        """Test that symbol info is fetched once and the tick once per order."""
+        mock_mt5.symbol_info.return_value = MagicMock(visible=True, digits=2)
+        mock_mt5.symbol_info_tick.return_value = MagicMock(ask=1950.5, bid=1950.0)
+        mock_mt5.order_send.return_value = MagicMock(
+            retcode=mock_mt5.TRADE_RETCODE_DONE, order=1
+        )
+        executor = OrderExecutor(self.config)
+
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.0,
+            take_profit=1980.0,
+            timestamp=datetime.now(),
+        )
+        symbol_config = self.config.symbols["XAUUSD"]
+
+        assert executor._send_order(signal, symbol_config).success is True
+        assert executor._send_order(signal, symbol_config).success is True
+
+        mock_mt5.symbol_info.assert_called_once_with("XAUUSD")
+        assert mock_mt5.symbol_info_tick.call_count == 2
+        assert mock_mt5.order_send.call_args[0][0]["price"] == 1950.5
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_send_order_rounds_stops_to_symbol_digits(
+        self, mock_mt5: MagicMock
+    ) -> None:
+        """Test that SL/TP are rounded to the symbol's price precision."""
+        mock_mt5.symbol_info.return_value = MagicMock(visible=True, digits=2)
+        mock_mt5.symbol_info_tick.return_value = MagicMock(ask=1950.5, bid=1950.0)
+        mock_mt5.order_send.return_value = MagicMock(
+            retcode=mock_mt5.TRADE_RETCODE_DONE, order=1
+        )
+        executor = OrderExecutor(self.config)
+
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.12345,
+            take_profit=1980.987,
+            timestamp=datetime.now(),
+        )
+
+        executor._send_order(signal, self.config.symbols["XAUUSD"])
+
+        request = mock_mt5.order_send.call_args[0][0]
+        assert request["sl"] == 1920.12
+        assert request["tp"] == 1980.99
+
+    @patch("src.order_executor.MT5_AVAILABLE", True)
+    @patch("src.order_executor.mt5")
+    def test_send_order_rounds_symbol_not_warmed_by_connect(
+        self, mock_mt5: MagicMock
+    ) -> None:
+        """Test that a symbol whose warm-up failed is still rounded."""
+        mock_mt5.symbol_info.return_value = None
+        executor = OrderExecutor(self.config)
+        assert executor.connect() is True
+        assert "XAUUSD" not in executor._digits
+
+        mock_mt5.symbol_info.return_value = MagicMock(visible=True, digits=2)
+        mock_mt5.symbol_info_tick.return_value = MagicMock(ask=1950.5, bid=1950.0)
+        mock_mt5.order_send.return_value = MagicMock(
+            retcode=mock_mt5.TRADE_RETCODE_DONE, order=1
+        )
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.12345,
+            take_profit=1980.987,
+            timestamp=datetime.now(),
+        )
+
+        assert executor._send_order(signal, self.config.symbols["XAUUSD"]).success
+
+        request = mock_mt5.order_send.call_args[0][0]
+        assert request["sl"] == 1920.12
+        assert request["tp"] == 1980.99
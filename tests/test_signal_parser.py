@@ -7,17 +7,19 @@ import pytest
 from src.signal_parser import Signal, SignalAction, SignalParser
 
 
+@pytest.fixture(scope="module")
+def parser() -> SignalParser:
+    """Parser shared by the module; it holds no per-message state."""
+    return SignalParser(valid_symbols=["XAUUSD", "BTCUSD", "ETHUSD"])
+
+
 class TestSignalParser:
     """Test cases for SignalParser."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.parser = SignalParser(valid_symbols=["XAUUSD", "BTCUSD", "ETHUSD"])
-
-    def test_parse_buy_signal(self) -> None:
+    def test_parse_buy_signal(self, parser: SignalParser) -> None:
         """Test parsing BUY signal with Ark_BTC prefix."""
         message = "Ark_BTC Alert: BUY XAUUSD SL:1920.50 TP:1950.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.BUY
@@ -26,10 +28,10 @@ class TestSignalParser:
         assert signal.take_profit == 1950.00
         assert not signal.is_close_signal()
 
-    def test_parse_sell_signal(self) -> None:
+    def test_parse_sell_signal(self, parser: SignalParser) -> None:
         """Test parsing SELL signal with Ark_BTC prefix."""
         message = "Ark_BTC Indicator SELL BTCUSD SL:45000.00 TP:42000.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.SELL
@@ -38,67 +40,97 @@ class TestSignalParser:
         assert signal.take_profit == 42000.00
         assert not signal.is_close_signal()
 
-    def test_parse_lowercase_action(self) -> None:
+    def test_parse_lowercase_action(self, parser: SignalParser) -> None:
         """Test parsing with lowercase action."""
         message = "Ark_BTC buy XAUUSD SL:1920.50 TP:1950.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.BUY
 
-    def test_parse_invalid_symbol(self) -> None:
+    def test_parse_invalid_symbol(self, parser: SignalParser) -> None:
         """Test parsing with invalid symbol."""
         message = "Ark_BTC BUY INVALID SL:100.00 TP:110.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is None
 
-    def test_parse_without_ark_prefix(self) -> None:
+    def test_parse_without_ark_prefix(self, parser: SignalParser) -> None:
         """Test parsing without Ark_BTC prefix returns None."""
         message = "BUY XAUUSD SL:1920.50 TP:1950.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is None
 
-    def test_parse_invalid_format(self) -> None:
+    def test_parse_invalid_format(self, parser: SignalParser) -> None:
         """Test parsing with invalid format."""
         invalid_messages = [
             "XAUUSD BUY",
             "BUY XAUUSD",
             "Ark_BTC BUY XAUUSD",
             "Ark_BTC BUY XAUUSD SL:1920.50",
+            "Ark_BTC BUY XAUUSD SL:1.2.3 TP:1950.00",
+            "Ark_BTC BUY XAUUSD SL:1920.5 TP:1950.0.5",
+            "Ark_BTC BUY XAUUSD SL:1920.5 TP:1950abc",
+            "Ark_BTC BUY XAUUSD SL: 1920.5 TP: 1950.0.5",
+            "Ark_BTC BUY XAUUSD SL: 1920.5 TP: 1950abc",
+            "Ark_BTC BUY XAUUSD SL:. TP:1950.00",
             "Random text message",
             "",
             "   ",
         ]
 
         for message in invalid_messages:
-            signal = self.parser.parse(message)
+            signal = parser.parse(message)
             assert signal is None, f"Expected None for: {message}"
 
-    def test_parse_with_whitespace(self) -> None:
+    def test_parse_with_whitespace(self, parser: SignalParser) -> None:
         """Test parsing with leading/trailing whitespace."""
         message = "  Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00  "
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.BUY
 
-    def test_is_valid_signal(self) -> None:
+    def test_parse_space_after_colon(self, parser: SignalParser) -> None:
+        """Test parsing with spaces after SL:/TP: (regex fallback path)."""
+        message = "Ark_BTC Alert: BUY XAUUSD SL: 1920.50 TP: 1950.00"
+        signal = parser.parse(message)
+
+        assert signal is not None
+        assert signal.stop_loss == 1920.50
+        assert signal.take_profit == 1950.00
+
+    def test_is_valid_signal(self, parser: SignalParser) -> None:
         """Test is_valid_signal method."""
-        assert self.parser.is_valid_signal("Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00")
-        assert not self.parser.is_valid_signal("BUY XAUUSD SL:1920.50 TP:1950.00")
-        assert not self.parser.is_valid_signal("Invalid message")
+        assert parser.is_valid_signal("Ark_BTC BUY XAUUSD SL:1920.50 TP:1950.00")
+        assert not parser.is_valid_signal("BUY XAUUSD SL:1920.50 TP:1950.00")
+        assert not parser.is_valid_signal("Invalid message")
 
-    def test_parse_all_symbols(self) -> None:
+    @pytest.mark.parametrize("symbol", ["XAUUSD", "BTCUSD", "ETHUSD"])
+    def test_parse_all_symbols(self, parser: SignalParser, symbol: str) -> None:
         """Test parsing signals for all valid symbols."""
+        message = f"Ark_BTC BUY {symbol} SL:100.00 TP:110.00"
+        signal = parser.parse(message)
+        assert signal is not None
+        assert signal.symbol == symbol
+
+    def test_parse_many_all_symbols(self, parser: SignalParser) -> None:
+        """Test batch parsing signals for all valid symbols."""
         symbols = ["XAUUSD", "BTCUSD", "ETHUSD"]
+        messages = [f"Ark_BTC BUY {symbol} SL:100.00 TP:110.00" for symbol in symbols]
+        messages += ["Random text message", "ロング決済サイン at price: 2650.50"]
+
+        signals = parser.parse_many(messages)
 
-        for symbol in symbols:
-            message = f"Ark_BTC BUY {symbol} SL:100.00 TP:110.00"
-            signal = self.parser.parse(message)
+        assert len(signals) == 5
+        for signal, symbol in zip(signals[:3], symbols):
             assert signal is not None
             assert signal.symbol == symbol
+        assert signals[3] is None
+        assert signals[4] is not None
+        assert signals[4].action == SignalAction.CLOSE_LONG
+        assert len({s.timestamp for s in signals if s is not None}) == 1
 
     def test_parser_without_symbol_filter(self) -> None:
         """Test parser without symbol filter accepts any symbol."""
@@ -113,14 +145,10 @@ class TestSignalParser:
 class TestCloseSignalParser:
     """Test cases for close signal parsing."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.parser = SignalParser(valid_symbols=["XAUUSD", "BTCUSD", "ETHUSD"])
-
-    def test_parse_close_long_signal(self) -> None:
+    def test_parse_close_long_signal(self, parser: SignalParser) -> None:
         """Test parsing close long signal."""
         message = "ロング決済サイン at price: 2650.50"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.CLOSE_LONG
@@ -129,20 +157,20 @@ class TestCloseSignalParser:
         assert signal.stop_loss is None
         assert signal.take_profit is None
 
-    def test_parse_close_short_signal(self) -> None:
+    def test_parse_close_short_signal(self, parser: SignalParser) -> None:
         """Test parsing close short signal."""
         message = "ショート決済サイン at price: 2600.00"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.CLOSE_SHORT
         assert signal.close_price == 2600.00
         assert signal.is_close_signal()
 
-    def test_close_signal_uses_first_symbol(self) -> None:
+    def test_close_signal_uses_first_symbol(self, parser: SignalParser) -> None:
         """Test that close signal uses first valid symbol."""
         message = "ロング決済サイン at price: 2650.50"
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.symbol == "XAUUSD"  # First in valid_symbols list
@@ -156,24 +184,27 @@ class TestCloseSignalParser:
         assert signal is not None
         assert signal.symbol == "XAUUSD"
 
-    def test_close_signal_with_whitespace(self) -> None:
+    def test_close_signal_with_whitespace(self, parser: SignalParser) -> None:
         """Test close signal with extra whitespace."""
         message = "  ロング決済サイン at price:  2650.50  "
-        signal = self.parser.parse(message)
+        signal = parser.parse(message)
 
         assert signal is not None
         assert signal.action == SignalAction.CLOSE_LONG
 
-    def test_invalid_close_signal_format(self) -> None:
+    def test_invalid_close_signal_format(self, parser: SignalParser) -> None:
         """Test invalid close signal formats."""
         invalid_messages = [
             "ロング決済サイン price: 2650.50",  # Missing "at"
             "ロング決済サイン at price:",  # Missing price
+            "ロング決済サイン at price: .",  # Not a number
+            "ロング決済サイン at price: 2650.50.1",  # Trailing garbage
+            "ロング決済サイン at price: 2650abc",  # Trailing garbage
             "決済サイン at price: 2650.50",  # Missing direction
         ]
 
         for message in invalid_messages:
-            signal = self.parser.parse(message)
+            signal = parser.parse(message)
             assert signal is None, f"Expected None for: {message}"
 
 
@@ -236,3 +267,17 @@ class TestSignal:
             timestamp=datetime.now(),
         )
         assert close_short.is_close_signal()
+
+    def test_signal_is_immutable(self) -> None:
+        """Test that Signal is frozen and hashable."""
+        signal = Signal(
+            action=SignalAction.BUY,
+            symbol="XAUUSD",
+            stop_loss=1920.50,
+            take_profit=1950.00,
+            timestamp=datetime.now(),
+        )
+
+        with pytest.raises(AttributeError):
+            signal.symbol = "BTCUSD"  # type: ignore[misc]
+        assert signal in {signal}
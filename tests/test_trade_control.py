@@ -1,13 +1,35 @@
 """Tests for trade_control module."""
 
-import json
-import tempfile
+import os
+import time
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from src.trade_control import TradeController, TradeControlState
+from src.trade_control import (
+    INOTIFY_AVAILABLE,
+    TradeController,
+    TradeControlState,
+    _parse_mt4_timestamp,
+)
+
+# Timestamp matching the "updated_at" payloads below
+_UPDATED_AT = datetime(2024, 1, 15, 10, 30)
+
+
+@pytest.fixture
+def control_file(tmp_path: Path) -> Path:
+    """Path for a trade control file in a per-test temporary directory.
+
+    Args:
+        tmp_path: Per-test temporary directory provided by pytest.
+
+    Returns:
+        Path to the (not yet created) control file.
+    """
+    return tmp_path / "trade_control.json"
 
 
 class TestTradeControlState:
@@ -22,14 +44,13 @@ class TestTradeControlState:
 
     def test_full_values(self) -> None:
         """Test with all values."""
-        now = datetime.now()
         state = TradeControlState(
             enabled=False,
-            updated_at=now,
+            updated_at=_UPDATED_AT,
             source="MT4_EA",
         )
         assert state.enabled is False
-        assert state.updated_at == now
+        assert state.updated_at is _UPDATED_AT
         assert state.source == "MT4_EA"
 
 
@@ -47,159 +68,224 @@ class TestTradeController:
         controller.set_default_enabled(False)
         assert controller.is_trade_enabled() is False
 
-    def test_read_enabled_true(self) -> None:
-        """Test reading enabled=true from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": True}, f)
-            temp_path = f.name
+    @pytest.mark.parametrize(
+        ("payload", "expected_enabled", "expected_state_is_none"),
+        [
+            (b'{"enabled": true}', True, False),
+            (b'{"enabled": false}', False, False),
+            (b'{"source": "test"}', True, False),  # Missing key uses default
+            (b"not valid json {", True, True),  # Invalid JSON uses default
+        ],
+        ids=["enabled", "disabled", "missing_key", "invalid_json"],
+    )
+    def test_read_enabled_flag(
+        self,
+        control_file: Path,
+        payload: bytes,
+        expected_enabled: bool,
+        expected_state_is_none: bool,
+    ) -> None:
+        """Test the enabled flag resolved from various file contents."""
+        control_file.write_bytes(payload)
+
+        controller = TradeController(control_file)
+        assert (controller.read_state() is None) is expected_state_is_none
+        assert controller.is_trade_enabled() is expected_enabled
+
+    def test_read_full_state(self, control_file: Path) -> None:
+        """Test reading full state from file."""
+        control_file.write_bytes(
+            b'{"enabled": true, "updated_at": "2024.01.15 10:30:00", '
+            b'"source": "MT4_EA"}'
+        )
 
-        try:
-            controller = TradeController(temp_path)
-            assert controller.is_trade_enabled() is True
-        finally:
-            Path(temp_path).unlink()
+        controller = TradeController(control_file)
+        state = controller.read_state()
 
-    def test_read_enabled_false(self) -> None:
-        """Test reading enabled=false from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": False}, f)
-            temp_path = f.name
+        assert state is not None
+        assert state.enabled is True
+        assert state.source == "MT4_EA"
+        assert state.updated_at is not None
+        assert state.updated_at.year == 2024
+
+    @pytest.mark.parametrize(
+        "updated_at",
+        ["2024.01.15 10:30:00", "2024-01-15T10:30:00"],
+        ids=["mt4", "iso"],
+    )
+    def test_read_updated_at_formats(self, control_file: Path, updated_at: str) -> None:
+        """Test that both MT4 and ISO timestamps are parsed."""
+        control_file.write_bytes(
+            b'{"enabled": true, "updated_at": "%s"}' % updated_at.encode()
+        )
+
+        state = TradeController(control_file).read_state()
+
+        assert state is not None
+        assert state.updated_at == _UPDATED_AT
+
+    def test_last_state_property(self, control_file: Path) -> None:
+        """Test last_state property."""
+        control_file.write_bytes(b'{"enabled": false}')
+
+        controller = TradeController(control_file)
+        assert controller.last_state is None
+
+        controller.read_state()
+        assert controller.last_state is not None
+        assert controller.last_state.enabled is False
+
+    def test_state_change_detected(self, control_file: Path) -> None:
+        """Test that state changes are tracked."""
+        control_file.write_bytes(b'{"enabled": true}')
+        controller = TradeController(control_file)
+
+        # First read
+        state1 = controller.read_state()
+        assert state1 is not None
+        assert state1.enabled is True
+
+        # Update file
+        control_file.write_bytes(b'{"enabled": false}')
+
+        # Second read
+        state2 = controller.read_state()
+        assert state2 is not None
+        assert state2.enabled is False
+
+    def test_path_as_string_or_path(self, control_file: Path) -> None:
+        """Test that both string and Path work."""
+        control_file.write_bytes(b'{"enabled": true}')
+
+        # String path
+        controller1 = TradeController(str(control_file))
+        assert controller1.is_trade_enabled() is True
+
+        # Path object
+        controller2 = TradeController(control_file)
+        assert controller2.is_trade_enabled() is True
+
+    def test_unchanged_file_not_reparsed(self, control_file: Path) -> None:
+        """Test that the file is only parsed again after it changes."""
+        control_file.write_bytes(b'{"enabled": true}')
+        controller = TradeController(control_file)
+
+        with patch.object(
+            controller, "_parse_file", wraps=controller._parse_file
+        ) as parse_mock:
+            first = controller.read_state()
+            second = controller.read_state()
+            assert first is second
+            assert parse_mock.call_count == 1
+
+            control_file.write_bytes(b'{"enabled": false}')
 
-        try:
-            controller = TradeController(temp_path)
             assert controller.is_trade_enabled() is False
-        finally:
-            Path(temp_path).unlink()
+            assert parse_mock.call_count == 2
 
-    def test_read_full_state(self) -> None:
-        """Test reading full state from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(
-                {
-                    "enabled": True,
-                    "updated_at": "2024.01.15 10:30:00",
-                    "source": "MT4_EA",
-                },
-                f,
-            )
-            temp_path = f.name
+    def test_replaced_file_detected(self, control_file: Path) -> None:
+        """Test that a same-size file renamed over the old one is re-read."""
+        control_file.write_bytes(b'{"enabled": true, "source": "aa"}')
+        controller = TradeController(control_file)
+        assert controller.is_trade_enabled() is True
 
-        try:
-            controller = TradeController(temp_path)
-            state = controller.read_state()
-
-            assert state is not None
-            assert state.enabled is True
-            assert state.source == "MT4_EA"
-            assert state.updated_at is not None
-            assert state.updated_at.year == 2024
-        finally:
-            Path(temp_path).unlink()
-
-    def test_read_iso_date_format(self) -> None:
-        """Test reading ISO date format."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(
-                {
-                    "enabled": True,
-                    "updated_at": "2024-01-15T10:30:00",
-                },
-                f,
-            )
-            temp_path = f.name
+        # Same size and mtime, only the inode differs
+        st = control_file.stat()
+        replacement = control_file.with_suffix(".tmp")
+        replacement.write_bytes(b'{"enabled": false, "source": "a"}')
+        assert replacement.stat().st_size == st.st_size
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, control_file)
 
-        try:
-            controller = TradeController(temp_path)
-            state = controller.read_state()
+        assert controller.is_trade_enabled() is False
 
-            assert state is not None
-            assert state.updated_at is not None
-        finally:
-            Path(temp_path).unlink()
 
-    def test_invalid_json_returns_none(self) -> None:
-        """Test that invalid JSON returns None."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json {")
-            temp_path = f.name
+class TestTradeControllerWatcher:
+    """Test cases for the background control file watcher."""
+
+    @pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify_simple not installed")
+    def test_watching_reads_initial_state(self, control_file: Path) -> None:
+        """Test that start_watching resolves the flag before returning."""
+        control_file.write_bytes(b'{"enabled": false}')
+        controller = TradeController(control_file)
 
+        controller.start_watching()
         try:
-            controller = TradeController(temp_path)
-            state = controller.read_state()
-            assert state is None
-            # Should fall back to default
-            assert controller.is_trade_enabled() is True
+            with patch.object(controller, "read_state") as read_mock:
+                assert controller.is_trade_enabled() is False
+                read_mock.assert_not_called()
         finally:
-            Path(temp_path).unlink()
+            controller.stop_watching()
 
-    def test_missing_enabled_key_uses_default(self) -> None:
-        """Test that missing enabled key uses default."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"source": "test"}, f)
-            temp_path = f.name
+    @pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify_simple not installed")
+    def test_watching_picks_up_file_change(self, control_file: Path) -> None:
+        """Test that the watcher thread notices a rewritten control file."""
+        control_file.write_bytes(b'{"enabled": true}')
+        controller = TradeController(control_file)
 
+        controller.start_watching()
         try:
-            controller = TradeController(temp_path)
-            # Default is True
             assert controller.is_trade_enabled() is True
+            control_file.write_bytes(b'{"enabled": false}')
+
+            deadline = time.monotonic() + 2.0
+            while controller.is_trade_enabled() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert controller.is_trade_enabled() is False
         finally:
-            Path(temp_path).unlink()
+            controller.stop_watching()
 
-    def test_last_state_property(self) -> None:
-        """Test last_state property."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": False}, f)
-            temp_path = f.name
+    @pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="inotify_simple not installed")
+    def test_set_default_enabled_while_watching(self, tmp_path: Path) -> None:
+        """Test that a new default applies at once when the file is missing."""
+        controller = TradeController(tmp_path / "missing.json")
 
+        controller.start_watching()
         try:
-            controller = TradeController(temp_path)
-            assert controller.last_state is None
-
-            controller.read_state()
-            assert controller.last_state is not None
-            assert controller.last_state.enabled is False
+            assert controller.is_trade_enabled() is True
+            controller.set_default_enabled(False)
+            assert controller.is_trade_enabled() is False
         finally:
-            Path(temp_path).unlink()
+            controller.stop_watching()
 
-    def test_state_change_detected(self) -> None:
-        """Test that state changes are tracked."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": True}, f)
-            temp_path = f.name
+    def test_without_inotify_reads_on_each_call(self, control_file: Path) -> None:
+        """Test that without inotify a disable applies to the very next call."""
+        control_file.write_bytes(b'{"enabled": true}')
+        controller = TradeController(control_file)
 
+        with patch("src.trade_control.INOTIFY_AVAILABLE", False):
+            controller.start_watching()
         try:
-            controller = TradeController(temp_path)
+            assert controller.is_watching is False
+            assert controller.is_trade_enabled() is True
+            control_file.write_bytes(b'{"enabled": false}')
+            assert controller.is_trade_enabled() is False
+        finally:
+            controller.stop_watching()
 
-            # First read
-            state1 = controller.read_state()
-            assert state1 is not None
-            assert state1.enabled is True
+    def test_stop_watching_reads_on_each_call_again(self, control_file: Path) -> None:
+        """Test that after stop_watching the file is consulted directly."""
+        control_file.write_bytes(b'{"enabled": true}')
+        controller = TradeController(control_file)
 
-            # Update file
-            with open(temp_path, "w") as f:
-                json.dump({"enabled": False}, f)
+        controller.start_watching()
+        controller.stop_watching()
+        controller.stop_watching()  # Second call is a no-op
 
-            # Second read
-            state2 = controller.read_state()
-            assert state2 is not None
-            assert state2.enabled is False
+        control_file.write_bytes(b'{"enabled": false}')
+        assert controller.is_trade_enabled() is False
 
-        finally:
-            Path(temp_path).unlink()
 
-    def test_path_as_string_or_path(self) -> None:
-        """Test that both string and Path work."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"enabled": True}, f)
-            temp_path = f.name
+class TestParseMt4Timestamp:
+    """Test cases for the fixed-position MT4 timestamp parser."""
 
-        try:
-            # String path
-            controller1 = TradeController(temp_path)
-            assert controller1.is_trade_enabled() is True
+    def test_parse_mt4_format(self) -> None:
+        """Test parsing the MT4 timestamp layout."""
+        assert _parse_mt4_timestamp("2024.01.15 10:30:05") == datetime(
+            2024, 1, 15, 10, 30, 5
+        )
 
-            # Path object
-            controller2 = TradeController(Path(temp_path))
-            assert controller2.is_trade_enabled() is True
-        finally:
-            Path(temp_path).unlink()
+    def test_other_layout_rejected(self) -> None:
+        """Test that non-MT4 layouts raise ValueError."""
+        with pytest.raises(ValueError):
+            _parse_mt4_timestamp("2024-01-15T10:30:00")